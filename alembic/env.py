@@ -18,9 +18,10 @@ sys.path.append(BASE_DIR)
 # ------------------------------------------
 from app.db.database import Base
 from app.models.device import DeviceDB
-from app.models.job import JobDB, JobAttempt, JobLog
+from app.models.job import JobDB, JobAttempt, JobLog, JobLogChunk, JobStatsDaily
 from app.models.audit import AuditEvent
 from app.models.snapshot import ConfigSnapshot
+from app.models.table_version import TableVersion
 
 
 # ------------------------------------------
@@ -0,0 +1,28 @@
+"""job attempt phase durations
+
+Revision ID: 5d1e7a3c9f20
+Revises: 2b5c8442ca84
+Create Date: 2026-10-19 09:12:04.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1e7a3c9f20'
+down_revision: Union[str, Sequence[str], None] = '2b5c8442ca84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_attempts', sa.Column('phase_durations', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job_attempts', 'phase_durations')
@@ -0,0 +1,30 @@
+"""config snapshot content hash
+
+Revision ID: 8a4f0c2b6e71
+Revises: 5d1e7a3c9f20
+Create Date: 2026-10-19 10:03:47.112904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4f0c2b6e71'
+down_revision: Union[str, Sequence[str], None] = '5d1e7a3c9f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('config_snapshots', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_config_snapshots_content_hash'), 'config_snapshots', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_config_snapshots_content_hash'), table_name='config_snapshots')
+    op.drop_column('config_snapshots', 'content_hash')
@@ -0,0 +1,32 @@
+"""audit filter indexes
+
+Revision ID: a5c3e7f91b26
+Revises: f2a6d8b0c513
+Create Date: 2026-10-19 14:32:08.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c3e7f91b26'
+down_revision: Union[str, Sequence[str], None] = 'f2a6d8b0c513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_audit_events_user_id_timestamp_id', 'audit_events', ['user_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_events_action_timestamp_id', 'audit_events', ['action', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_events_target_timestamp_id', 'audit_events', ['target', 'timestamp', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_audit_events_target_timestamp_id', table_name='audit_events')
+    op.drop_index('ix_audit_events_action_timestamp_id', table_name='audit_events')
+    op.drop_index('ix_audit_events_user_id_timestamp_id', table_name='audit_events')
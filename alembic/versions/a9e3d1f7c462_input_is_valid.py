@@ -0,0 +1,48 @@
+"""input_is_valid() for PostgreSQL 15
+
+Revision ID: a9e3d1f7c462
+Revises: f1b7c3e5a820
+Create Date: 2026-10-19 20:41:37.125804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3d1f7c462'
+down_revision: Union[str, Sequence[str], None] = 'f1b7c3e5a820'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Bulk import and the subnet filter validate text input in SQL.
+    # pg_input_is_valid() is PostgreSQL 16+; older servers get a cast
+    # attempt that traps data exceptions (one subtransaction per call).
+    if op.get_bind().dialect.server_version_info >= (16,):
+        op.execute("""
+            CREATE FUNCTION input_is_valid(value text, type_name text) RETURNS boolean
+            LANGUAGE sql STABLE STRICT AS $$
+                SELECT pg_input_is_valid(value, type_name)
+            $$
+        """)
+    else:
+        op.execute("""
+            CREATE FUNCTION input_is_valid(value text, type_name text) RETURNS boolean
+            LANGUAGE plpgsql STABLE STRICT AS $$
+            BEGIN
+                EXECUTE format('SELECT %L::%s', value, type_name::regtype);
+                RETURN true;
+            EXCEPTION WHEN data_exception THEN
+                RETURN false;
+            END
+            $$
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION IF EXISTS input_is_valid(text, text)")
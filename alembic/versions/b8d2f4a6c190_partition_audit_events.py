@@ -0,0 +1,117 @@
+"""partition audit_events by month
+
+Revision ID: b8d2f4a6c190
+Revises: a5c3e7f91b26
+Create Date: 2026-10-19 15:10:44.203917
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f4a6c190'
+down_revision: Union[str, Sequence[str], None] = 'a5c3e7f91b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# months created ahead at migration time; the daily beat task keeps going
+PARTITIONS_AHEAD = 2
+
+COLUMNS = "id, user_id, username, role, action, target, endpoint, timestamp, details"
+
+INDEXES = [
+    ('ix_audit_events_id', ['id']),
+    ('ix_audit_events_timestamp_id', ['timestamp', 'id']),
+    ('ix_audit_events_user_id_timestamp_id', ['user_id', 'timestamp', 'id']),
+    ('ix_audit_events_action_timestamp_id', ['action', 'timestamp', 'id']),
+    ('ix_audit_events_target_timestamp_id', ['target', 'timestamp', 'id']),
+]
+
+
+def _add_months(dt, months):
+    index = dt.year * 12 + (dt.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _audit_columns(timestamp_nullable):
+    return [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('audit_events_id_seq')"), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('username', sa.String(length=100), nullable=True),
+        sa.Column('role', sa.String(length=50), nullable=True),
+        sa.Column('action', sa.String(length=200), nullable=False),
+        sa.Column('target', sa.String(length=255), nullable=True),
+        sa.Column('endpoint', sa.String(length=255), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=timestamp_nullable),
+        sa.Column('details', sa.JSON(), nullable=True),
+    ]
+
+
+def _swap_out_old_table(old_name):
+    """Rename audit_events away and free its index/constraint names."""
+    op.execute(f"ALTER TABLE audit_events RENAME TO {old_name}")
+    op.execute(f"ALTER TABLE {old_name} RENAME CONSTRAINT audit_events_pkey TO {old_name}_pkey")
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def _create_indexes():
+    for name, columns in INDEXES:
+        op.create_index(name, 'audit_events', columns, unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _swap_out_old_table('audit_events_legacy')
+
+    # partition key is part of the primary key, so it cannot be NULL
+    op.execute("UPDATE audit_events_legacy SET timestamp = now() AT TIME ZONE 'utc' WHERE timestamp IS NULL")
+
+    op.create_table('audit_events',
+    *_audit_columns(timestamp_nullable=False),
+    sa.PrimaryKeyConstraint('id', 'timestamp'),
+    postgresql_partition_by='RANGE (timestamp)'
+    )
+    # keep the existing id sequence (and its position)
+    op.execute("ALTER SEQUENCE audit_events_id_seq OWNED BY audit_events.id")
+
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+
+    oldest = op.get_bind().execute(sa.text("SELECT min(timestamp) FROM audit_events_legacy")).scalar()
+    now = datetime.utcnow()
+    month = datetime((oldest or now).year, (oldest or now).month, 1)
+    last = _add_months(datetime(now.year, now.month, 1), PARTITIONS_AHEAD)
+
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE audit_events_p{month:%Y%m} PARTITION OF audit_events "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+        month = upper
+
+    op.execute(f"INSERT INTO audit_events ({COLUMNS}) SELECT {COLUMNS} FROM audit_events_legacy")
+    op.drop_table('audit_events_legacy')
+
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _swap_out_old_table('audit_events_partitioned')
+
+    op.create_table('audit_events',
+    *_audit_columns(timestamp_nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("ALTER SEQUENCE audit_events_id_seq OWNED BY audit_events.id")
+
+    op.execute(f"INSERT INTO audit_events ({COLUMNS}) SELECT {COLUMNS} FROM audit_events_partitioned")
+    # drops every partition with it
+    op.drop_table('audit_events_partitioned')
+
+    _create_indexes()
@@ -0,0 +1,41 @@
+"""job log chunks
+
+Revision ID: c37b9e5d1a48
+Revises: 8a4f0c2b6e71
+Create Date: 2026-10-19 11:20:15.640317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c37b9e5d1a48'
+down_revision: Union[str, Sequence[str], None] = '8a4f0c2b6e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_log_chunks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('attempt_id', sa.Integer(), nullable=True),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('data', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['attempt_id'], ['job_attempts.id'], ),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('job_id', 'seq', name='uq_job_log_chunks_job_seq')
+    )
+    op.create_index(op.f('ix_job_log_chunks_id'), 'job_log_chunks', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_job_log_chunks_id'), table_name='job_log_chunks')
+    op.drop_table('job_log_chunks')
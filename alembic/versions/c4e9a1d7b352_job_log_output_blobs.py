@@ -0,0 +1,32 @@
+"""job log output blobs
+
+Revision ID: c4e9a1d7b352
+Revises: b8d2f4a6c190
+Create Date: 2026-10-19 16:02:17.448120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a1d7b352'
+down_revision: Union[str, Sequence[str], None] = 'b8d2f4a6c190'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_logs', sa.Column('output_blob', sa.String(length=255), nullable=True))
+    op.add_column('job_logs', sa.Column('output_size', sa.BigInteger(), nullable=True))
+    op.add_column('job_logs', sa.Column('output_sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job_logs', 'output_sha256')
+    op.drop_column('job_logs', 'output_size')
+    op.drop_column('job_logs', 'output_blob')
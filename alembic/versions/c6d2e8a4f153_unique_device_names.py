@@ -0,0 +1,38 @@
+"""unique device names
+
+Revision ID: c6d2e8a4f153
+Revises: a9e3d1f7c462
+Create Date: 2026-10-19 23:12:48.406217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d2e8a4f153'
+down_revision: Union[str, Sequence[str], None] = 'a9e3d1f7c462'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Bulk import upserts by name (ON CONFLICT (name)). Duplicates are not
+    # merged here: which row survives is an operator decision.
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT name, array_agg(id ORDER BY id) AS ids FROM devices "
+        "GROUP BY name HAVING count(*) > 1 ORDER BY name LIMIT 20"
+    )).all()
+    if duplicates:
+        listing = ", ".join(f"{name!r} (ids {ids})" for name, ids in duplicates)
+        raise RuntimeError(f"Duplicate device names, rename or delete them first: {listing}")
+
+    op.create_index('uq_devices_name', 'devices', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_devices_name', table_name='devices')
@@ -0,0 +1,53 @@
+"""job stats daily rollup
+
+Revision ID: d7f3b5e9a264
+Revises: c4e9a1d7b352
+Create Date: 2026-10-19 16:41:52.906314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f3b5e9a264'
+down_revision: Union[str, Sequence[str], None] = 'c4e9a1d7b352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_stats_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('device_id', sa.Integer(), nullable=False),
+    sa.Column('platform', sa.String(length=100), nullable=True),
+    sa.Column('succeeded', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('failed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('duration_seconds_total', sa.Float(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('day', 'device_id')
+    )
+
+    # backfill from history (same rules as app/worker/job_stats.py)
+    op.execute("""
+        INSERT INTO job_stats_daily (day, device_id, platform, succeeded, failed, duration_seconds_total)
+        SELECT (a.completed_at AT TIME ZONE 'UTC')::date,
+               j.device_id,
+               max(d.platform),
+               sum(CASE WHEN a.exit_code = 0 THEN 1 ELSE 0 END),
+               sum(CASE WHEN a.exit_code = 0 THEN 0 ELSE 1 END),
+               sum(coalesce(EXTRACT(epoch FROM a.completed_at - a.started_at), 0))
+        FROM job_attempts a
+        JOIN jobs j ON j.id = a.job_id
+        JOIN devices d ON d.id = j.device_id
+        WHERE a.completed_at IS NOT NULL
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_stats_daily')
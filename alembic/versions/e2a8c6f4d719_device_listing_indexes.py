@@ -0,0 +1,33 @@
+"""device listing indexes
+
+Revision ID: e2a8c6f4d719
+Revises: d7f3b5e9a264
+Create Date: 2026-10-19 17:20:36.115842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8c6f4d719'
+down_revision: Union[str, Sequence[str], None] = 'd7f3b5e9a264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_devices_platform_id', 'devices', ['platform', 'id'], unique=False)
+    op.create_index(
+        'ix_devices_name_pattern', 'devices', ['name'], unique=False,
+        postgresql_ops={'name': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_devices_name_pattern', table_name='devices')
+    op.drop_index('ix_devices_platform_id', table_name='devices')
@@ -0,0 +1,42 @@
+"""job attempt counter
+
+Revision ID: e91f4a7c2d05
+Revises: c37b9e5d1a48
+Create Date: 2026-10-19 12:41:09.275113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91f4a7c2d05'
+down_revision: Union[str, Sequence[str], None] = 'c37b9e5d1a48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('attempt_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from existing attempts so attempt_no keeps increasing
+    op.execute(
+        """
+        UPDATE jobs
+        SET attempt_count = sub.max_no
+        FROM (
+            SELECT job_id, MAX(attempt_no) AS max_no
+            FROM job_attempts
+            GROUP BY job_id
+        ) AS sub
+        WHERE jobs.id = sub.job_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jobs', 'attempt_count')
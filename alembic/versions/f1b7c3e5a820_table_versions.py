@@ -0,0 +1,64 @@
+"""table_versions change counters
+
+Revision ID: f1b7c3e5a820
+Revises: e2a8c6f4d719
+Create Date: 2026-10-19 18:05:12.408731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b7c3e5a820'
+down_revision: Union[str, Sequence[str], None] = 'e2a8c6f4d719'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tables whose version backs an ETag
+TRACKED_TABLES = ('devices',)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'table_versions',
+        sa.Column('table_name', sa.String(length=63), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='1', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+
+    # FOR EACH STATEMENT: one counter update per write statement, however
+    # many rows it touches (bulk import upserts bump it once)
+    op.execute("""
+        CREATE FUNCTION bump_table_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO table_versions (table_name, version, updated_at)
+            VALUES (TG_TABLE_NAME, 1, now())
+            ON CONFLICT (table_name) DO UPDATE
+                SET version = table_versions.version + 1,
+                    updated_at = now();
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    for table in TRACKED_TABLES:
+        op.execute(f"INSERT INTO table_versions (table_name) VALUES ('{table}')")
+        op.execute(f"""
+            CREATE TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_table_version()")
+    op.drop_table('table_versions')
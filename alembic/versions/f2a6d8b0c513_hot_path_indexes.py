@@ -0,0 +1,53 @@
+"""hot path indexes
+
+Revision ID: f2a6d8b0c513
+Revises: e91f4a7c2d05
+Create Date: 2026-10-19 13:55:31.084662
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6d8b0c513'
+down_revision: Union[str, Sequence[str], None] = 'e91f4a7c2d05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_job_attempts_job_id_attempt_no', 'job_attempts', ['job_id', 'attempt_no'], unique=False)
+    op.create_index('ix_jobs_device_id_status', 'jobs', ['device_id', 'status'], unique=False)
+    op.create_index(
+        'ix_jobs_pending_created_at', 'jobs', ['created_at'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index('ix_job_logs_job_id_created_at', 'job_logs', ['job_id', 'created_at'], unique=False)
+    op.create_index('ix_job_logs_attempt_id', 'job_logs', ['attempt_id'], unique=False)
+    op.create_index('ix_audit_events_timestamp_id', 'audit_events', ['timestamp', 'id'], unique=False)
+    op.create_index(
+        'ix_config_snapshots_device_id_created_at', 'config_snapshots',
+        ['device_id', 'created_at', 'id'], unique=False,
+    )
+
+    # users is created outside these migrations (separate declarative Base)
+    if sa.inspect(op.get_bind()).has_table('users'):
+        op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if sa.inspect(op.get_bind()).has_table('users'):
+        op.drop_index(op.f('ix_users_username'), table_name='users')
+
+    op.drop_index('ix_config_snapshots_device_id_created_at', table_name='config_snapshots')
+    op.drop_index('ix_audit_events_timestamp_id', table_name='audit_events')
+    op.drop_index('ix_job_logs_attempt_id', table_name='job_logs')
+    op.drop_index('ix_job_logs_job_id_created_at', table_name='job_logs')
+    op.drop_index('ix_jobs_pending_created_at', table_name='jobs', postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_index('ix_jobs_device_id_status', table_name='jobs')
+    op.drop_index('ix_job_attempts_job_id_attempt_no', table_name='job_attempts')
@@ -1,15 +1,100 @@
 # app/api/audit_api.py
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional
 
-from app.db.database import get_db
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.replicas import get_read_db, read_sessionmaker
 from app.models.audit import AuditEvent
 from app.api.deps import require_role
+from app.utils.fast_json import FastJSONResponse
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.response_cache import cached_response
+from app.utils.streaming import export_response
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
+MAX_PAGE_SIZE = 500
+
+EXPORT_COLUMNS = list(AuditEvent.__table__.c)
+EXPORT_COLUMN_NAMES = [c.key for c in EXPORT_COLUMNS]
+
+
+def audit_filters(user_id, action, target, since, until) -> list:
+    """WHERE clauses shared by the list and export endpoints."""
+    clauses = []
+    if user_id is not None:
+        clauses.append(AuditEvent.user_id == user_id)
+    if action:
+        clauses.append(AuditEvent.action == action)
+    if target:
+        clauses.append(AuditEvent.target == target)
+    if since:
+        clauses.append(AuditEvent.timestamp >= since)
+    if until:
+        clauses.append(AuditEvent.timestamp < until)
+    return clauses
+
 
 @router.get("/", dependencies=[Depends(require_role("admin", "auditor"))])
-def list_audit_events(db: Session = Depends(get_db)):
-    return db.query(AuditEvent).order_by(AuditEvent.timestamp.desc()).all()
+@cached_response("audit")
+async def list_audit_events(
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    target: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="timestamp >= since"),
+    until: Optional[datetime] = Query(None, description="timestamp < until"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Newest-first audit events, keyset-paginated on (timestamp, id).
+    Follow `next_cursor` until it is null.
+    """
+    # plain columns, no AuditEvent objects
+    stmt = select(*EXPORT_COLUMNS).where(*audit_filters(user_id, action, target, since, until))
+
+    if cursor:
+        ts, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(AuditEvent.timestamp, AuditEvent.id) < (ts, row_id))
+
+    # one extra row tells us whether another page exists
+    stmt = stmt.order_by(AuditEvent.timestamp.desc(), AuditEvent.id.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).mappings().all()
+
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["timestamp"], last["id"])
+
+    return FastJSONResponse({"items": items, "next_cursor": next_cursor})
+
+
+@router.get("/export", dependencies=[Depends(require_role("admin", "auditor"))])
+async def export_audit_events(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(csv|ndjson)$"),
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    target: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="timestamp >= since"),
+    until: Optional[datetime] = Query(None, description="timestamp < until"),
+):
+    """
+    Oldest-first audit events as NDJSON or CSV, streamed in batches from a
+    server-side cursor. Use since/until to bound the range to the months
+    you need: only the matching partitions are scanned.
+    """
+    stmt = (
+        select(*EXPORT_COLUMNS)
+        .where(*audit_filters(user_id, action, target, since, until))
+        .order_by(AuditEvent.timestamp, AuditEvent.id)
+    )
+
+    session_factory = await read_sessionmaker(request)
+    return export_response(session_factory, stmt, format, EXPORT_COLUMN_NAMES, "audit_events")
@@ -1,8 +1,7 @@
 # app/api/deps.py
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
 
 from app.core.security import verify_token
 
@@ -10,14 +9,15 @@ from app.core.security import verify_token
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+# async: pure CPU work, so no reason to hop to the threadpool
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     Decodes the JWT and returns its payload.
     """
     try:
         token_data = verify_token(token)
         return token_data
-    except JWTError:
+    except Exception:  # verify_token re-raises JWTError as a plain Exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -31,7 +31,7 @@ def require_role(*allowed_roles):
     Usage:
         Depends(require_role("admin", "operator"))
     """
-    def inner(token_data = Depends(get_current_user)):
+    async def inner(token_data = Depends(get_current_user)):
         role = token_data.get("role")
 
         if role not in allowed_roles:
@@ -43,3 +43,30 @@ def require_role(*allowed_roles):
         return token_data
 
     return inner
+
+
+def _token_payload(request: Request) -> dict:
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return {}
+
+    try:
+        return verify_token(token)
+    except Exception:
+        return {}
+
+
+def request_role(request: Request) -> str:
+    """
+    Role from an optional bearer token, "anonymous" without a valid one.
+    For cache keys and budgets only: authorization uses require_role.
+    """
+    return _token_payload(request).get("role") or "anonymous"
+
+
+def request_subject(request: Request) -> str | None:
+    """
+    Subject ("sub") of an optional bearer token, None without a valid one.
+    For read routing only: authorization uses require_role.
+    """
+    return _token_payload(request).get("sub")
@@ -1,10 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import ipaddress
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import String, case, cast, false, func, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import CIDR, INET
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
 from app.models.device import DeviceDB
 from app.schemas.device import DeviceCreate
 from app.utils.auth import get_current_user
-from app.db.database import get_db
+from app.db.database import get_async_db
+from app.db.replicas import get_read_db, read_sessionmaker
+from app.utils.device_import import ImportFormatError, import_devices
+from app.utils.etag import etag_headers, etag_matches, make_etag, not_modified, table_version
+from app.utils.fast_json import FastJSONResponse
+from app.utils.response_cache import cached_response, invalidate_cache
+from app.utils.streaming import export_response
 
 router = APIRouter(prefix="/devices", tags=["Devices"])
 
@@ -12,20 +24,172 @@ router = APIRouter(prefix="/devices", tags=["Devices"])
 # ➕ Add Device (Admin Only)
 # ---------------------------
 @router.post("/")
-def add_device(device: DeviceCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
+async def add_device(device: DeviceCreate, db: AsyncSession = Depends(get_async_db), current_user=Depends(get_current_user)):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can add devices")
 
-    new_device = DeviceDB(name=device.name, ip=device.ip)
+    new_device = DeviceDB(
+        name=device.name,
+        ip=device.ip,
+        platform=device.platform,
+        credentials_ref=device.credentials_ref,
+        port=device.port,
+    )
     db.add(new_device)
-    db.commit()
-    db.refresh(new_device)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail=f"Device '{device.name}' already exists")
+    await invalidate_cache("devices")
     return {"message": f"✅ Device '{device.name}' added by {current_user.username}"}
 
 # ---------------------------
-# 📋 Get All Devices
+# 📋 List Devices (paginated)
+# ---------------------------
+# Column projection: rows come back as tuples, no DeviceDB objects are
+# built. credentials_ref is deliberately not part of the listing.
+LIST_COLUMNS = (DeviceDB.id, DeviceDB.name, DeviceDB.ip, DeviceDB.platform, DeviceDB.port)
+LIST_COLUMN_NAMES = [c.key for c in LIST_COLUMNS]
+MAX_PAGE_SIZE = 500
+
+
+def device_filters(platform: str | None, name_prefix: str | None, subnet: str | None):
+    conditions = []
+
+    if platform:
+        conditions.append(DeviceDB.platform == platform)
+
+    if name_prefix:
+        # prefix LIKE can use ix_devices_name_pattern
+        conditions.append(DeviceDB.name.startswith(name_prefix, autoescape=True))
+
+    if subnet:
+        try:
+            network = ipaddress.ip_network(subnet, strict=False)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid subnet: {subnet}")
+
+        # ip is free text: rows that are not a valid address never match
+        # (input_is_valid: PostgreSQL 15 compatible, see app/utils/device_import.py)
+        conditions.append(
+            case(
+                (func.input_is_valid(DeviceDB.ip, "inet"), cast(DeviceDB.ip, INET).op("<<=")(cast(literal(str(network), String), CIDR))),
+                else_=false(),
+            )
+        )
+
+    return conditions
+
+
+# Read routes authenticate from the JWT alone (app.api.deps): no users
+# lookup per request, so a response-cache hit costs no DB round trip.
+@router.get("/", dependencies=[Depends(deps.get_current_user)])
+@cached_response("devices")
+async def get_devices(
+    request: Request,
+    after: int = Query(0, ge=0, description="Return devices with id > after"),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    platform: str | None = None,
+    name_prefix: str | None = None,
+    subnet: str | None = Query(None, description="e.g. 10.1.0.0/16"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Devices ordered by id; page with `after=<next_after>` until it is null.
+    Send the ETag back as If-None-Match: 304 while the inventory is unchanged.
+    """
+    # version first, rows second (see app/utils/etag.py)
+    version = await table_version(db, "devices")
+    etag = make_etag("devices", version, request.url.query) if version is not None else None
+    if etag and etag_matches(request, etag):
+        return not_modified(etag)
+
+    rows = (await db.execute(
+        select(*LIST_COLUMNS)
+        .where(DeviceDB.id > after, *device_filters(platform, name_prefix, subnet))
+        .order_by(DeviceDB.id)
+        .limit(limit)
+    )).mappings().all()
+
+    # rows are encoded as-is (no per-row dicts, no jsonable_encoder pass)
+    return FastJSONResponse({
+        "devices": rows,
+        "next_after": rows[-1]["id"] if len(rows) == limit else None,
+    }, headers=etag_headers(etag) if etag else None)
+
+
 # ---------------------------
-@router.get("/")
-def get_devices(db: Session = Depends(get_db)):
-    devices = db.query(DeviceDB).all()
-    return {"devices": [{"id": d.id, "name": d.name, "ip": d.ip} for d in devices]}
+# 📤 Export Devices (streamed)
+# ---------------------------
+@router.get("/export", dependencies=[Depends(deps.get_current_user)])
+async def export_devices(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(csv|ndjson)$"),
+    platform: str | None = None,
+    name_prefix: str | None = None,
+    subnet: str | None = None,
+):
+    """
+    Whole (filtered) inventory as NDJSON or CSV, streamed in batches.
+    Conditional: If-None-Match with the last ETag returns 304.
+    """
+    stmt = (
+        select(*LIST_COLUMNS)
+        .where(*device_filters(platform, name_prefix, subnet))
+        .order_by(DeviceDB.id)
+    )
+
+    session_factory = await read_sessionmaker(request)
+
+    async with session_factory() as db:
+        version = await table_version(db, "devices")
+    etag = make_etag("devices", version, request.url.query) if version is not None else None
+    if etag and etag_matches(request, etag):
+        return not_modified(etag)
+
+    response = export_response(session_factory, stmt, format, LIST_COLUMN_NAMES, "devices")
+    if etag:
+        response.headers.update(etag_headers(etag))
+    return response
+
+
+# ---------------------------
+# 📥 Bulk Import (Admin Only)
+# ---------------------------
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/import")
+async def import_devices_bulk(
+    request: Request,
+    format: str | None = Query(None, pattern="^(csv|ndjson)$", description="overrides Content-Type"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Upsert devices (keyed by name) from a CSV or NDJSON request body.
+    CSV needs a header row: name, ip, platform, credentials_ref[, port].
+    Invalid rows are reported per row and skipped; valid rows are applied.
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can import devices")
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = format or IMPORT_CONTENT_TYPES.get(content_type)
+    if fmt is None:
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson")
+
+    try:
+        result = await import_devices(db, fmt, request.stream())
+    except ImportFormatError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    await invalidate_cache("devices")
+    return result
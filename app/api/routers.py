@@ -1,8 +1,15 @@
 from fastapi import APIRouter
 from app.api.v1 import health
 from app.api.v1 import jobs_api   # ← THIS WAS MISSING
+from app.api.v1 import stats_api
+from app.api.v1 import rules_api
+from app.api import audit_api, devices_api
 
 router = APIRouter()
 
 router.include_router(health.router)
-router.include_router(jobs_api.router, prefix="/v1")
\ No newline at end of file
+router.include_router(jobs_api.router, prefix="/v1")
+router.include_router(stats_api.router, prefix="/v1")
+router.include_router(rules_api.router, prefix="/v1")
+router.include_router(devices_api.router, prefix="/v1")
+router.include_router(audit_api.router, prefix="/v1")
\ No newline at end of file
@@ -2,9 +2,9 @@
 
 from fastapi import APIRouter
 from sqlalchemy import text
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
 from app.core.config import settings
-import redis
+import redis.asyncio as redis
 
 router = APIRouter()
 
@@ -14,7 +14,7 @@ router = APIRouter()
 # NOT used by Kubernetes probes
 # --------------------------------------------------
 @router.get("/health/full", tags=["system"])
-def health_check():
+async def health_check():
     status = {
         "postgres": "unknown",
         "redis": "unknown",
@@ -23,27 +23,23 @@ def health_check():
     # ---------------------------
     # PostgreSQL Check
     # ---------------------------
-    db = None
     try:
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
         status["postgres"] = "ok"
     except Exception as e:
         status["postgres"] = f"error: {str(e)}"
-    finally:
-        if db:
-            try:
-                db.close()
-            except Exception:
-                pass
 
     # ---------------------------
     # Redis Check
     # ---------------------------
     try:
         r = redis.Redis.from_url(settings.REDIS_URL)
-        r.set("health_check", "ok")
-        value = r.get("health_check")
+        try:
+            await r.set("health_check", "ok")
+            value = await r.get("health_check")
+        finally:
+            await r.aclose()
 
         if value.decode() == "ok":
             status["redis"] = "ok"
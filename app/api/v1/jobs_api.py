@@ -1,11 +1,26 @@
 # app/api/v1/jobs_api.py
 
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import load_only, raiseload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 import logging
 
-from app.db.database import get_db
-from app.models.job import JobDB
+from app.api.deps import require_role
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, get_async_db
+from app.db.replicas import get_read_db, read_sessionmaker
+from app.models.job import JobDB, JobAttempt, JobLog, JobLogChunk
+from app.utils.blobstore import blob_path, iter_blob
+from app.utils.admission import require_queue_capacity
+from app.utils.fast_json import FastJSONResponse
+from app.utils.job_events import TERMINAL_STATUSES, publish_status, stream_job_events
+from app.utils.response_cache import cached_response, invalidate_cache
+from app.utils.streaming import export_response
 from app.metrics import get_metrics
 from app.worker.celery_app import celery_app  # ✅ correct import
 
@@ -14,13 +29,13 @@ router = APIRouter(prefix="/jobs", tags=["jobs"])
 logger = logging.getLogger(__name__)
 
 
-@router.post("/run/{job_id}")
-def run_job_async(job_id: int, db: Session = Depends(get_db)):
+@router.post("/run/{job_id}", dependencies=[Depends(require_queue_capacity("celery"))])
+async def run_job_async(job_id: int, db: AsyncSession = Depends(get_async_db)):
 
     # -----------------------------
     # Validate job exists
     # -----------------------------
-    job = db.get(JobDB, job_id)
+    job = await db.get(JobDB, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -34,18 +49,36 @@ def run_job_async(job_id: int, db: Session = Depends(get_db)):
 
     metrics["pushed"].inc()
 
+    # -----------------------------
+    # Persist QUEUED before the message exists: a worker may start it
+    # (RUNNING) right away, and an expired message only fails a job
+    # that is still QUEUED (see expire_queued_run)
+    # -----------------------------
+    previous_status = job.status
+    job.status = "QUEUED"
+    await db.commit()
+    await invalidate_cache("jobs")
+
     # -----------------------------
     # Enqueue Celery task (CORRECT WAY)
     # -----------------------------
+    # send_task is blocking Redis I/O: keep it off the event loop
     try:
-        celery_app.send_task(
+        await run_in_threadpool(
+            celery_app.send_task,
             "app.worker.tasks.run_job",  # ✅ fully qualified name
             args=[job_id],
+            # stale if still queued this long: workers discard it
+            expires=settings.JOB_QUEUE_EXPIRES_SECONDS,
         )
         logger.info(f"Job {job_id} enqueued")
+        await run_in_threadpool(publish_status, job_id, "QUEUED")
 
     except Exception as e:
         logger.error(f"Failed to enqueue job {job_id}: {e}")
+        job.status = previous_status
+        await db.commit()
+        await invalidate_cache("jobs")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to enqueue job: {e}"
@@ -57,4 +90,312 @@ def run_job_async(job_id: int, db: Session = Depends(get_db)):
     return {
         "job_id": job.id,
         "status": "QUEUED"
-    }
\ No newline at end of file
+    }
+
+
+# ==========================================================
+# Job status (read-only, replica-routed)
+# ==========================================================
+@router.get("/{job_id}")
+async def get_job_status(job_id: int, db: AsyncSession = Depends(get_read_db)):
+    job = (await db.execute(
+        select(JobDB.id, JobDB.name, JobDB.device_id, JobDB.status, JobDB.attempt_count, JobDB.created_at)
+        .where(JobDB.id == job_id)
+    )).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return {
+        "job_id": job.id,
+        "name": job.name,
+        "device_id": job.device_id,
+        "status": job.status,
+        "attempts": job.attempt_count,
+        "created_at": job.created_at,
+    }
+
+
+# ==========================================================
+# Job list + detail (eager loading, fixed query count)
+# ==========================================================
+# Relationships are loaded with selectinload (one IN query per
+# relationship, whatever the page size) and everything else is
+# raiseload("*"): an accidental lazy load fails loudly instead of
+# silently turning into N+1. scripts/check_query_counts.py asserts
+# the counts below.
+#
+#   GET /jobs/           : jobs + attempts + log summaries = 3 queries
+#   GET /jobs/{id}/detail: job + attempts + one page of logs = 3 queries
+
+LOG_SUMMARY_COLUMNS = (JobLog.id, JobLog.job_id, JobLog.attempt_id, JobLog.exit_code, JobLog.created_at, JobLog.output_size)
+
+
+def _attempt_dict(a: JobAttempt) -> dict:
+    return {
+        "id": a.id,
+        "attempt_no": a.attempt_no,
+        "started_at": a.started_at,
+        "completed_at": a.completed_at,
+        "exit_code": a.exit_code,
+        "phase_durations": a.phase_durations,
+    }
+
+
+def _log_dict(log: JobLog, with_output: bool = False) -> dict:
+    data = {
+        "id": log.id,
+        "attempt_id": log.attempt_id,
+        "exit_code": log.exit_code,
+        "created_at": log.created_at,
+        "output_size": log.output_size,
+    }
+    if with_output:
+        data["output"] = log.output
+        data["output_blob"] = log.output_blob is not None
+        data["output_sha256"] = log.output_sha256
+    return data
+
+
+@router.get("/")
+@cached_response("jobs")
+async def list_jobs(
+    status: str | None = None,
+    device_id: int | None = None,
+    before: int | None = Query(None, description="Return jobs with id < before"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Newest jobs first; page with `before=<next_before>`."""
+    stmt = select(JobDB).options(
+        selectinload(JobDB.attempts),
+        selectinload(JobDB.logs).options(load_only(*LOG_SUMMARY_COLUMNS, raiseload=True)),
+        raiseload("*"),
+    )
+
+    if status:
+        stmt = stmt.where(JobDB.status == status)
+    if device_id is not None:
+        stmt = stmt.where(JobDB.device_id == device_id)
+    if before is not None:
+        stmt = stmt.where(JobDB.id < before)
+
+    jobs = (await db.scalars(stmt.order_by(JobDB.id.desc()).limit(limit))).all()
+
+    return FastJSONResponse({
+        "jobs": [
+            {
+                "id": job.id,
+                "name": job.name,
+                "device_id": job.device_id,
+                "status": job.status,
+                "created_at": job.created_at,
+                "attempts": [_attempt_dict(a) for a in sorted(job.attempts, key=lambda a: a.attempt_no)],
+                "logs": [_log_dict(log) for log in sorted(job.logs, key=lambda log: log.id)],
+            }
+            for job in jobs
+        ],
+        "next_before": jobs[-1].id if len(jobs) == limit else None,
+    })
+
+
+@router.get("/{job_id}/detail", dependencies=[Depends(require_role("admin", "operator", "auditor"))])
+async def get_job_detail(
+    job_id: int,
+    logs_after: int = Query(0, ge=0, description="Return logs with id > logs_after"),
+    logs_limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """Job with all attempts and one page of logs (oldest first)."""
+    job = (await db.scalars(
+        select(JobDB)
+        .where(JobDB.id == job_id)
+        .options(selectinload(JobDB.attempts), raiseload("*"))
+    )).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    logs = (await db.scalars(
+        select(JobLog)
+        .where(JobLog.job_id == job_id, JobLog.id > logs_after)
+        .options(raiseload("*"))
+        .order_by(JobLog.id)
+        .limit(logs_limit)
+    )).all()
+
+    return FastJSONResponse({
+        "id": job.id,
+        "name": job.name,
+        "device_id": job.device_id,
+        "command": job.command,
+        "status": job.status,
+        "created_at": job.created_at,
+        "attempts": [_attempt_dict(a) for a in sorted(job.attempts, key=lambda a: a.attempt_no)],
+        "logs": [_log_dict(log, with_output=True) for log in logs],
+        "next_logs_after": logs[-1].id if len(logs) == logs_limit else None,
+    })
+
+
+# ==========================================================
+# Job output tail (incremental, from job_log_chunks)
+# ==========================================================
+@router.get("/{job_id}/output", dependencies=[Depends(require_role("admin", "operator", "auditor"))])
+async def tail_job_output(
+    job_id: int,
+    after: int = Query(0, ge=0, description="Return chunks with seq > after"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Tail-style read: poll with `after=<next_after>` from the previous
+    response until `complete` is true and no chunks are returned.
+    """
+    job = await db.get(JobDB, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    rows = (await db.execute(
+        select(JobLogChunk.seq, JobLogChunk.attempt_id, JobLogChunk.data, JobLogChunk.created_at)
+        .where(JobLogChunk.job_id == job_id, JobLogChunk.seq > after)
+        .order_by(JobLogChunk.seq)
+        .limit(limit)
+    )).all()
+
+    return FastJSONResponse({
+        "job_id": job_id,
+        "status": job.status,
+        "complete": job.status in TERMINAL_STATUSES,
+        "chunks": rows,  # (seq, attempt_id, data, created_at) rows, encoded directly
+        "next_after": rows[-1].seq if rows else after,
+    })
+
+
+# ==========================================================
+# Live job events (server-sent events, Redis pub/sub)
+# ==========================================================
+@router.get("/{job_id}/events", dependencies=[Depends(require_role("admin", "operator", "auditor"))])
+async def job_events(
+    job_id: int,
+    after: int = Query(0, ge=0, description="Replay chunks with seq > after"),
+    last_event_id: int | None = Header(None, ge=0),
+):
+    """
+    text/event-stream of `status` and `chunk` events until the job reaches
+    SUCCESS/FAILED. Browsers reconnect with Last-Event-ID automatically;
+    output already sent is not replayed.
+    """
+    if not settings.JOB_EVENTS_ENABLED:
+        raise HTTPException(status_code=503, detail="Live job events are disabled, poll /jobs/{job_id}/output")
+
+    # short-lived session, not a dependency: yield dependencies are only
+    # torn down once the response body is done, i.e. when the stream ends
+    async with AsyncSessionLocal() as db:
+        exists = await db.scalar(select(JobDB.id).where(JobDB.id == job_id))
+    if exists is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # replay reads the primary: a lagging replica could miss chunks whose
+    # events were published before this stream subscribed
+    return StreamingResponse(
+        stream_job_events(AsyncSessionLocal, job_id, max(after, last_event_id or 0)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ==========================================================
+# Final job log output (inline or gzip blob)
+# ==========================================================
+@router.get(
+    "/{job_id}/logs/{log_id}/output",
+    dependencies=[Depends(require_role("admin", "operator", "auditor"))],
+)
+async def get_job_log_output(
+    job_id: int,
+    log_id: int,
+    request: Request,
+):
+    """
+    Full output of one job log. Blob-stored outputs are streamed: as-is
+    (gzip) when the client accepts it, decompressed on the fly otherwise.
+    """
+    # not get_read_db: its session would stay open until the blob is sent
+    session_factory = await read_sessionmaker(request)
+    async with session_factory() as db:
+        log = (await db.execute(
+            select(JobLog.output, JobLog.output_blob, JobLog.output_size, JobLog.output_sha256)
+            .where(JobLog.id == log_id, JobLog.job_id == job_id)
+        )).first()
+    if not log:
+        raise HTTPException(status_code=404, detail="Job log not found")
+
+    if not log.output_blob:
+        return PlainTextResponse(log.output or "")
+
+    headers = {
+        "X-Output-Size": str(log.output_size),
+        "X-Output-SHA256": log.output_sha256,
+    }
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return FileResponse(blob_path(log.output_blob), media_type="text/plain; charset=utf-8", headers=headers)
+
+    # gzip reads are blocking file I/O: keep them off the event loop
+    return StreamingResponse(
+        iterate_in_threadpool(iter_blob(log.output_blob)),
+        media_type="text/plain; charset=utf-8",
+        headers=headers,
+    )
+
+
+# ==========================================================
+# Job history export (streamed NDJSON / CSV)
+# ==========================================================
+# One row per job log, flattened with its job and attempt. Inline output
+# is included on request; blob-stored outputs are referenced by
+# output_blob/output_sha256 and fetched from /jobs/{id}/logs/{log_id}/output.
+HISTORY_COLUMNS = (
+    JobLog.id.label("log_id"),
+    JobLog.job_id,
+    JobDB.name.label("job_name"),
+    JobDB.device_id,
+    JobDB.status.label("job_status"),
+    JobAttempt.attempt_no,
+    JobLog.exit_code,
+    JobLog.created_at,
+    JobLog.output_size,
+    JobLog.output_blob,
+    JobLog.output_sha256,
+)
+
+
+@router.get("/logs/export", dependencies=[Depends(require_role("admin", "operator", "auditor"))])
+async def export_job_history(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(csv|ndjson)$"),
+    device_id: int | None = None,
+    status: str | None = None,
+    since: datetime | None = Query(None, description="log created_at >= since"),
+    until: datetime | None = Query(None, description="log created_at < until"),
+    include_output: bool = Query(False, description="Include inline log output"),
+):
+    """Job logs (oldest first) as NDJSON or CSV, streamed in batches."""
+    columns = HISTORY_COLUMNS + ((JobLog.output,) if include_output else ())
+
+    stmt = (
+        select(*columns)
+        .join(JobDB, JobDB.id == JobLog.job_id)
+        .outerjoin(JobAttempt, JobAttempt.id == JobLog.attempt_id)
+        .order_by(JobLog.id)
+    )
+    if device_id is not None:
+        stmt = stmt.where(JobDB.device_id == device_id)
+    if status:
+        stmt = stmt.where(JobDB.status == status)
+    if since:
+        stmt = stmt.where(JobLog.created_at >= since)
+    if until:
+        stmt = stmt.where(JobLog.created_at < until)
+
+    session_factory = await read_sessionmaker(request)
+    return export_response(session_factory, stmt, format, [c.key for c in columns], "job_history")
@@ -0,0 +1,56 @@
+# app/api/v1/rules_api.py
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Request, Response
+
+from app.api.deps import get_current_user
+from app.utils.etag import etag_headers, etag_matches, not_modified
+
+router = APIRouter(prefix="/rules", tags=["rules"])
+
+RULES_DIR = Path(__file__).resolve().parents[3] / "rules"
+
+RULE_SETS = {
+    "root-cause": RULES_DIR / "root_cause_rules.json",
+    "recommendations": RULES_DIR / "investigation_recommendations.json",
+    "correlation": RULES_DIR / "correlation_rules.json",
+}
+
+# name -> ((mtime_ns, size), etag, body); re-read only when the file changes
+_cache: dict = {}
+
+
+def _load(name: str):
+    path = RULE_SETS[name]
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _cache.get(name)
+    if cached and cached[0] == key:
+        return cached
+
+    body = path.read_bytes()
+    # strong ETag: digest of the exact bytes served
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    _cache[name] = (key, etag, body)
+    return _cache[name]
+
+
+# ==========================================================
+# Rule sets (raw JSON, conditional GET)
+# ==========================================================
+@router.get("/{name}", dependencies=[Depends(get_current_user)])
+async def get_rule_set(name: Literal["root-cause", "recommendations", "correlation"], request: Request):
+    """
+    Rule set file as served to automation clients. Send the ETag back as
+    If-None-Match: 304 (no body) until the file changes.
+    """
+    _, etag, body = _load(name)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    return Response(content=body, media_type="application/json", headers=etag_headers(etag))
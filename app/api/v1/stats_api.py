@@ -0,0 +1,74 @@
+# app/api/v1/stats_api.py
+
+from datetime import datetime, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.replicas import get_read_db
+from app.models.job import JobStatsDaily
+from app.utils.response_cache import cached_response
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+GROUP_COLUMNS = {
+    "day": JobStatsDaily.day,
+    "device": JobStatsDaily.device_id,
+    "platform": JobStatsDaily.platform,
+}
+
+
+# ==========================================================
+# Job summary (reads job_stats_daily only)
+# ==========================================================
+@router.get("/jobs")
+@cached_response("jobs")
+async def job_summary(
+    days: int = Query(7, ge=1, le=366),
+    group_by: Literal["day", "device", "platform"] = "day",
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Success/failure counts and rates over the last `days` UTC days,
+    grouped by day, device or platform.
+    """
+    since = (datetime.utcnow() - timedelta(days=days - 1)).date()
+    key = GROUP_COLUMNS[group_by]
+
+    rows = (await db.execute(
+        select(
+            key.label("key"),
+            func.sum(JobStatsDaily.succeeded).label("succeeded"),
+            func.sum(JobStatsDaily.failed).label("failed"),
+            func.sum(JobStatsDaily.duration_seconds_total).label("duration"),
+        )
+        .where(JobStatsDaily.day >= since)
+        .group_by(key)
+        .order_by(key)
+    )).all()
+
+    def summarize(succeeded, failed, duration):
+        total = succeeded + failed
+        return {
+            "succeeded": succeeded,
+            "failed": failed,
+            "total": total,
+            "success_rate": round(succeeded / total, 4) if total else None,
+            "avg_duration_seconds": round(duration / total, 2) if total else None,
+        }
+
+    groups = [{"key": r.key, **summarize(r.succeeded, r.failed, r.duration)} for r in rows]
+
+    return {
+        "since": since,
+        "days": days,
+        "group_by": group_by,
+        "totals": summarize(
+            sum(r.succeeded for r in rows),
+            sum(r.failed for r in rows),
+            sum(r.duration for r in rows),
+        ),
+        "groups": groups,
+    }
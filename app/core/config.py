@@ -19,6 +19,8 @@ class Settings(BaseSettings):
 
     # Core settings
     DATABASE_URL: str | None = None
+    # Async (asyncpg) URL for API routes; derived from DATABASE_URL if unset
+    ASYNC_DATABASE_URL: str | None = None
     REDIS_URL: str | None = "redis://redis:6379/1"
     SECRET_KEY: str | None = None
 
@@ -35,10 +37,105 @@ class Settings(BaseSettings):
 
     ACCESS_TOKEN_EXPIRE_MINUTES: int | None = 60
 
+    # API responses rendered with orjson (app/utils/fast_json.py); falls
+    # back to stdlib json when orjson is not installed
+    FAST_JSON_ENABLED: bool = True
+
+    # gzip for responses above GZIP_MINIMUM_SIZE bytes (static assets are
+    # precompressed at build time: scripts/build_static.py)
+    GZIP_ENABLED: bool = True
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 5
+
+    # Database connection pools, per process role (api | worker | migration).
+    # PROCESS_ROLE unset: detected from the command line (celery/alembic/else api).
+    PROCESS_ROLE: str | None = None
+    DB_API_POOL_SIZE: int = 5
+    DB_API_MAX_OVERFLOW: int = 5
+    DB_WORKER_POOL_SIZE: int = 2
+    DB_WORKER_MAX_OVERFLOW: int = 3
+    DB_POOL_TIMEOUT_SECONDS: int = 3
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # PgBouncer transaction pooling: no client-side pool (NullPool)
+    DB_PGBOUNCER_MODE: bool = False
+
+    # Read replicas for read-only API routes (comma-separated URLs, empty = off)
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_TIMEOUT_SECONDS: float = 1.0
+    # reads go to the primary this long after the same client wrote
+    READ_YOUR_WRITES_SECONDS: int = 10
+
     # Optional
     PGADMIN_DEFAULT_EMAIL: str | None = None
     PGADMIN_DEFAULT_PASSWORD: str | None = None
     VAULT_HEALTH_TEST_PATH: str | None = None
+    SECRET_CACHE_TTL_SECONDS: int = 300
+
+    # Claim-check transport for large task payloads
+    PAYLOAD_INLINE_MAX_BYTES: int = 4096
+    PAYLOAD_TTL_SECONDS: int = 86400
+
+    # Celery queues
+    DEVICE_IO_QUEUE: str = "device_io"
+    BACKUP_QUEUE: str = "backup"
+
+    # Admission control on job submission (app/utils/admission.py):
+    # 429 + Retry-After above these broker queue limits
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_MAX_QUEUE_DEPTH: int = 500
+    ADMISSION_MAX_QUEUE_AGE_SECONDS: float = 300
+    # per-role multipliers of both limits ("role:factor,..."; others 1)
+    ADMISSION_ROLE_BUDGETS: str = "admin:4,operator:1,anonymous:0.5"
+    ADMISSION_CHECK_INTERVAL_SECONDS: float = 1.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 30
+    # jobs still queued after this are discarded by workers (Celery expires)
+    # and marked FAILED (app/worker/celery_app.py, _on_task_revoked)
+    JOB_QUEUE_EXPIRES_SECONDS: int = 3600
+
+    # Scheduled fleet backup (Celery beat)
+    BACKUP_SWEEP_ENABLED: bool = True
+    BACKUP_WINDOW_SECONDS: int = 3600
+    BACKUP_SLOT_SECONDS: int = 60
+    BACKUP_CHUNK_SIZE: int = 25
+
+    # Monthly audit_events partitions (Celery beat)
+    AUDIT_PARTITION_MAINTENANCE_ENABLED: bool = True
+    AUDIT_PARTITIONS_AHEAD: int = 2
+    AUDIT_RETENTION_MONTHS: int = 12
+
+    # job_stats_daily rollup reconciliation (Celery beat)
+    JOB_STATS_RECONCILE_SECONDS: int = 900
+    JOB_STATS_RECONCILE_DAYS: int = 2
+
+    # Incremental job output (job_log_chunks)
+    JOB_OUTPUT_CHUNK_CHARS: int = 16384
+
+    # Final job outputs above this size go to the gzip blob store
+    JOB_OUTPUT_INLINE_MAX_BYTES: int = 32768
+    BLOB_STORE_DIR: str = "/app/blobs"
+
+    # Redis response cache for read-heavy routes (app/utils/response_cache.py)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_MAX_BYTES: int = 1048576
+    RESPONSE_CACHE_TIMEOUT_SECONDS: float = 0.25
+
+    # Live job events (Redis pub/sub -> SSE, app/utils/job_events.py)
+    JOB_EVENTS_ENABLED: bool = True
+    JOB_EVENTS_HEARTBEAT_SECONDS: int = 15
+    JOB_EVENTS_MAX_STREAM_SECONDS: int = 3600
+
+    # Worker warm-up + health endpoint
+    WORKER_HEALTH_PORT: int = 8001
+    WORKER_STATE_DIR: str = "/tmp/worker-state"
+    WORKER_WARMUP_TIMEOUT_SECONDS: int = 20
+    WORKER_WARMUP_DB_CONNECTIONS: int = 2
+    WORKER_WARMUP_MODULES: str = "netmiko,paramiko,netmiko.ssh_dispatcher"
+    WORKER_PREFETCH_SECRETS: str = ""   # comma-separated extra Vault paths
+    WORKER_PREFETCH_SECRETS_LIMIT: int = 20
 
 
 settings = Settings()
@@ -1,8 +1,18 @@
+import os
+import sys
+import time
+import uuid
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from app.core.config import settings
+from app.metrics import get_db_pool_metrics
 
 # -------------------------------
 # Database Configuration
@@ -11,12 +21,90 @@ from app.core.config import settings
 # Always use the DATABASE_URL from settings
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
+
+# -------------------------------
+# Process Role
+# -------------------------------
+# uvicorn workers x Celery children all open their own pool, so pool
+# sizes are chosen per role to stay under Postgres max_connections.
+
+def detect_process_role() -> str:
+    if settings.PROCESS_ROLE:
+        return settings.PROCESS_ROLE
+
+    program = os.path.basename(sys.argv[0]) if sys.argv else ""
+    if "celery" in program:
+        return "worker"
+    if "alembic" in program:
+        return "migration"
+    return "api"
+
+
+PROCESS_ROLE = detect_process_role()
+
+
+# -------------------------------
+# Instrumented Pools
+# -------------------------------
+class _CheckoutMetricsMixin:
+    """
+    Records checkout count, wait time and timeouts per role.
+    _do_get is where a pool blocks for a free connection.
+    """
+
+    def _do_get(self):
+        metrics = get_db_pool_metrics()
+        start = time.perf_counter()
+
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            metrics["timeouts"].labels(role=PROCESS_ROLE).inc()
+            raise
+        finally:
+            metrics["wait"].labels(role=PROCESS_ROLE).observe(time.perf_counter() - start)
+
+        metrics["checkouts"].labels(role=PROCESS_ROLE).inc()
+        return conn
+
+
+class InstrumentedQueuePool(_CheckoutMetricsMixin, QueuePool):
+    pass
+
+
+class InstrumentedNullPool(_CheckoutMetricsMixin, NullPool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutMetricsMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_pool_options(role: str, is_async: bool = False) -> dict:
+    # Migrations are one-shot; PgBouncer (transaction pooling) already pools
+    if role == "migration" or settings.DB_PGBOUNCER_MODE:
+        return {"poolclass": InstrumentedNullPool}
+
+    if role == "worker":
+        size, overflow = settings.DB_WORKER_POOL_SIZE, settings.DB_WORKER_MAX_OVERFLOW
+    else:
+        size, overflow = settings.DB_API_POOL_SIZE, settings.DB_API_MAX_OVERFLOW
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": size,
+        "max_overflow": overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    pool_pre_ping=True,
-    pool_timeout=3,
-    connect_args={"connect_timeout": 3}
+    connect_args={"connect_timeout": 3},
+    **engine_pool_options(PROCESS_ROLE),
 )
 
 # Create session factory
@@ -26,6 +114,47 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# -------------------------------
+# Async Engine (API routes)
+# -------------------------------
+# Same database, asyncpg driver: async routes wait on Postgres without
+# holding one of the anyio threadpool threads.
+
+def as_async_url(url: str) -> str:
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def build_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    return as_async_url(SQLALCHEMY_DATABASE_URL)
+
+
+def async_connect_args() -> dict:
+    args = {"timeout": 3}
+
+    if settings.DB_PGBOUNCER_MODE:
+        # Transaction pooling: no statement cache, unique prepared statement names
+        args["statement_cache_size"] = 0
+        args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+
+    return args
+
+
+async_engine = create_async_engine(
+    build_async_database_url(),
+    connect_args=async_connect_args(),
+    **engine_pool_options(PROCESS_ROLE, is_async=True),
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -36,3 +165,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# FastAPI dependency (async routes)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
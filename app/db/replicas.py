@@ -0,0 +1,218 @@
+# app/db/replicas.py
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import List, Optional
+
+import redis.asyncio as aioredis
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.deps import request_subject
+from app.core.config import settings
+from app.db.database import (
+    PROCESS_ROLE,
+    AsyncSessionLocal,
+    as_async_url,
+    async_connect_args,
+    engine_pool_options,
+)
+from app.metrics import get_db_pool_metrics
+
+logger = logging.getLogger("netdevops")
+
+# ==========================================================
+# READ REPLICAS
+# ==========================================================
+# Read-only API dependencies (get_read_db) are served from a replica
+# when one is configured AND healthy:
+#
+#   - lag is checked at most every REPLICA_LAG_CHECK_INTERVAL_SECONDS
+#     per replica; a replica behind REPLICA_MAX_LAG_SECONDS is skipped
+#   - no healthy replica -> primary
+#   - the client wrote within READ_YOUR_WRITES_SECONDS -> primary
+#     (last-write cookie, plus a Redis key per token subject so other
+#     clients of the same user - scripts, no cookie jar - see the write
+#     too; both set by the API middleware)
+#
+# Workers and every write path keep using the primary engines.
+
+LAST_WRITE_COOKIE = "nd_last_write"
+LAST_WRITE_KEY_PREFIX = "last-write:"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# 0 when fully replayed; NULL when nothing was replayed yet (unknown lag)
+REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END"
+)
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.engine = create_async_engine(
+            as_async_url(url),
+            connect_args=async_connect_args(),
+            **engine_pool_options(PROCESS_ROLE, is_async=True),
+        )
+        self.sessionmaker = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        self.name = self.engine.url.host or "replica"
+        self.lag: Optional[float] = None
+        self.checked_at = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return self.lag is not None and self.lag <= settings.REPLICA_MAX_LAG_SECONDS
+
+    async def refresh(self):
+        if time.monotonic() - self.checked_at < settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+            return
+
+        self.checked_at = time.monotonic()
+        try:
+            # timeout covers connect + query: a dead replica must not stall reads
+            lag = await asyncio.wait_for(
+                self._query_lag(),
+                timeout=settings.REPLICA_LAG_CHECK_TIMEOUT_SECONDS,
+            )
+            self.lag = None if lag is None else float(lag)
+        except Exception as e:
+            logger.warning(f"Replica {self.name} lag check failed: {e!r}")
+            self.lag = None
+
+    async def _query_lag(self):
+        async with self.engine.connect() as conn:
+            return await conn.scalar(REPLICA_LAG_SQL)
+
+
+def _build_replicas() -> List[Replica]:
+    urls = [u.strip() for u in settings.DATABASE_REPLICA_URLS.split(",") if u.strip()]
+    return [Replica(url) for url in urls]
+
+
+replicas = _build_replicas()
+_next_replica = itertools.count()
+
+
+async def pick_replica() -> Optional[Replica]:
+    """Round-robin over replicas, skipping lagging/unreachable ones."""
+    if not replicas:
+        return None
+
+    start = next(_next_replica)
+    for i in range(len(replicas)):
+        replica = replicas[(start + i) % len(replicas)]
+        await replica.refresh()
+        if replica.healthy:
+            return replica
+
+    return None
+
+
+# ----------------------------------------
+# Read-your-writes
+# ----------------------------------------
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+
+    if _redis_client is None:
+        timeout = settings.REPLICA_LAG_CHECK_TIMEOUT_SECONDS
+        _redis_client = aioredis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+
+    return _redis_client
+
+
+def _cookie_wrote_recently(request: Request) -> bool:
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, 0))
+    except ValueError:
+        return False
+
+    return time.time() - last_write < settings.READ_YOUR_WRITES_SECONDS
+
+
+async def wrote_recently(request: Request) -> bool:
+    if _cookie_wrote_recently(request):
+        return True
+
+    subject = request_subject(request)
+    if subject is None:
+        return False
+
+    try:
+        return bool(await _get_redis().exists(f"{LAST_WRITE_KEY_PREFIX}{subject}"))
+    except Exception as e:
+        # can't tell: stay on the primary rather than risk a stale read
+        logger.warning(f"Read-your-writes lookup failed: {e!r}")
+        return True
+
+
+async def mark_write(request: Request, response):
+    response.set_cookie(
+        LAST_WRITE_COOKIE,
+        f"{time.time():.3f}",
+        max_age=settings.READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax",
+    )
+
+    subject = request_subject(request)
+    if subject is None or not replicas:
+        return
+
+    try:
+        await _get_redis().set(
+            f"{LAST_WRITE_KEY_PREFIX}{subject}", 1, ex=settings.READ_YOUR_WRITES_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Read-your-writes mark failed: {e!r}")
+
+
+async def read_sessionmaker(request: Request):
+    """
+    Session factory for a read-only request: replica or primary.
+    Streaming endpoints use this directly: get_read_db's session is only
+    closed after the response body is sent, i.e. held for the whole
+    stream. Everything else goes through get_read_db.
+    """
+    reads = get_db_pool_metrics()["reads"]
+
+    if not replicas:
+        factory, target, reason = AsyncSessionLocal, "primary", "no_replica"
+    elif await wrote_recently(request):
+        factory, target, reason = AsyncSessionLocal, "primary", "recent_write"
+    else:
+        replica = await pick_replica()
+        if replica is None:
+            factory, target, reason = AsyncSessionLocal, "primary", "replica_lag"
+        else:
+            factory, target, reason = replica.sessionmaker, "replica", "ok"
+
+    reads.labels(target=target, reason=reason).inc()
+    return factory
+
+
+# FastAPI dependency (read-only async routes)
+async def get_read_db(request: Request):
+    factory = await read_sessionmaker(request)
+
+    async with factory() as db:
+        yield db
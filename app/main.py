@@ -9,13 +9,14 @@ import time
 from urllib import response 
 PROM_DIR = "/tmp/prometheus-shared" 
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 from sqlalchemy import text
 from prometheus_client import Counter,Histogram 
 
-from app.db.database import SessionLocal
+from app.db.database import AsyncSessionLocal
+from app.db.replicas import SAFE_METHODS, mark_write
 
 # -----------------------------
 # Routers & Config
@@ -24,6 +25,8 @@ from app.api.routers import router as api_router
 from app.api.v1.health import router as health_router
 from app.core.config import settings
 from app.metrics import setup_metrics
+from app.utils.fast_json import FastJSONResponse, serializer_name
+from app.utils.static_assets import PrecompressedStaticFiles, static_build_dir
 
 # -----------------------------
 # Celery Task Import (CRITICAL)
@@ -61,8 +64,20 @@ logger.info("App starting...")
 app = FastAPI(
     title="Network DevOps Automation Platform",
     description="Production-grade Network Automation Backend",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=FastJSONResponse if settings.FAST_JSON_ENABLED else JSONResponse,
 )
+logger.info(f"JSON responses: {serializer_name() if settings.FAST_JSON_ENABLED else 'starlette'}")
+
+# Response compression above GZIP_MINIMUM_SIZE bytes. Already-encoded
+# responses (precompressed assets, gzip job outputs) and SSE streams
+# pass through untouched.
+if settings.GZIP_ENABLED:
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.GZIP_MINIMUM_SIZE,
+        compresslevel=settings.GZIP_COMPRESS_LEVEL,
+    )
 # ----------------------------------------
 # API RED METRICS (Phase 3.5)
 # ----------------------------------------
@@ -125,6 +140,21 @@ async def metrics_middleware(request, call_next):
     return response
 
 
+# ==========================================================
+# READ-YOUR-WRITES (replica routing)
+# ==========================================================
+# A successful write pins this client's reads to the primary for
+# READ_YOUR_WRITES_SECONDS (see app/db/replicas.py).
+@app.middleware("http")
+async def read_your_writes_middleware(request, call_next):
+    response = await call_next(request)
+
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        await mark_write(request, response)
+
+    return response
+
+
 
 # ============================
 # 🚨 JOB TRIGGER ENDPOINT (TESTING)
@@ -198,7 +228,7 @@ app.include_router(health_router)
 # Health: Liveness
 # ============================
 @app.get("/health")
-def health():
+async def health():
     return {"status": "alive"}
 
 
@@ -206,22 +236,16 @@ def health():
 # Health: Readiness
 # ============================
 @app.get("/health/ready")
-def health_ready():
-    db = None
+async def health_ready():
     try:
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.commit()
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
         return {"status": "ready"}
 
     except Exception as e:
         logger.error(f"❌ DB readiness failed: {e}")
         raise HTTPException(status_code=503, detail=str(e))
 
-    finally:
-        if db:
-            db.close()
-
 
 # ============================
 # Root Endpoint
@@ -240,11 +264,13 @@ def home():
 # ============================
 # Static Dashboard
 # ============================
+# Built assets (scripts/build_static.py) when present: precompressed,
+# revalidated by ETag. See app/utils/static_assets.py.
 static_dir = os.path.join(os.path.dirname(__file__), "static")
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+static_files = PrecompressedStaticFiles(directory=static_build_dir(static_dir))
+app.mount("/static", static_files, name="static")
 
 
 @app.get("/dashboard")
-def get_dashboard():
-    dashboard_path = os.path.join(static_dir, "dashboard.html")
-    return FileResponse(dashboard_path)
\ No newline at end of file
+async def get_dashboard(request: Request):
+    return await static_files.get_response("dashboard.html", request.scope)
\ No newline at end of file
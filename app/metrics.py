@@ -10,6 +10,7 @@ from prometheus_client import (
 )
 from fastapi import Response
 import os
+import threading
 
 # ----------------------------------------
 # CRITICAL: multiprocess safety
@@ -26,13 +27,27 @@ _jobs_pushed_total = None
 _jobs_success_total = None
 _jobs_failed_total = None
 _job_execution_duration_seconds = None
+_job_phase_duration_seconds = None
+
+# Network operations: 100ms (fast CLI command) .. 10min (large rollback)
+JOB_PHASE_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# Thread-pool workers call get_metrics() concurrently: without the lock
+# two threads can both see None and register the same metric twice.
+_metrics_lock = threading.Lock()
 
 
 def get_metrics(scope: str = "all"):
+    with _metrics_lock:
+        return _get_metrics(scope)
+
+
+def _get_metrics(scope: str):
     global _jobs_pushed_total
     global _jobs_success_total
     global _jobs_failed_total
     global _job_execution_duration_seconds
+    global _job_phase_duration_seconds
 
     if _jobs_pushed_total is None:
         _jobs_pushed_total = Counter(
@@ -58,6 +73,14 @@ def get_metrics(scope: str = "all"):
             "Time taken for a config job",
         )
 
+    if _job_phase_duration_seconds is None:
+        _job_phase_duration_seconds = Histogram(
+            "job_phase_duration_seconds",
+            "Time spent per config job phase (connect, snapshot_fetch, apply, verify, rollback)",
+            ["phase"],
+            buckets=JOB_PHASE_BUCKETS,
+        )
+
     # ----------------------------------------
     # 🔒 ENFORCEMENT LAYER (CRITICAL FIX)
     # ----------------------------------------
@@ -66,6 +89,7 @@ def get_metrics(scope: str = "all"):
         "success": _jobs_success_total,
         "failed": _jobs_failed_total,
         "duration": _job_execution_duration_seconds,
+        "phase_duration": _job_phase_duration_seconds,
     }
 
     if scope == "api":
@@ -78,11 +102,111 @@ def get_metrics(scope: str = "all"):
             "success": metrics["success"],
             "failed": metrics["failed"],
             "duration": metrics["duration"],
+            "phase_duration": metrics["phase_duration"],
         }
 
     return metrics 
 
 
+# ----------------------------------------
+# DB pool metrics (API + worker)
+# ----------------------------------------
+
+_db_pool_checkouts_total = None
+_db_pool_checkout_timeouts_total = None
+_db_pool_checkout_wait_seconds = None
+_db_read_routing_total = None
+
+# Checkout waits: sub-ms when a connection is idle, seconds when exhausted
+DB_POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+def get_db_pool_metrics():
+    global _db_pool_checkouts_total
+    global _db_pool_checkout_timeouts_total
+    global _db_pool_checkout_wait_seconds
+    global _db_read_routing_total
+
+    with _metrics_lock:
+        if _db_pool_checkouts_total is None:
+            _db_pool_checkouts_total = Counter(
+                "db_pool_checkouts_total",
+                "Connections checked out of the SQLAlchemy pool",
+                ["role"],
+            )
+
+        if _db_pool_checkout_timeouts_total is None:
+            _db_pool_checkout_timeouts_total = Counter(
+                "db_pool_checkout_timeouts_total",
+                "Pool checkouts that timed out (pool exhausted)",
+                ["role"],
+            )
+
+        if _db_pool_checkout_wait_seconds is None:
+            _db_pool_checkout_wait_seconds = Histogram(
+                "db_pool_checkout_wait_seconds",
+                "Time to obtain a DB connection from the pool (wait + connect)",
+                ["role"],
+                buckets=DB_POOL_WAIT_BUCKETS,
+            )
+
+        if _db_read_routing_total is None:
+            _db_read_routing_total = Counter(
+                "db_read_routing_total",
+                "Read-only API sessions by target (replica/primary) and reason",
+                ["target", "reason"],
+            )
+
+    return {
+        "checkouts": _db_pool_checkouts_total,
+        "timeouts": _db_pool_checkout_timeouts_total,
+        "wait": _db_pool_checkout_wait_seconds,
+        "reads": _db_read_routing_total,
+    }
+
+
+# ----------------------------------------
+# Response cache metrics (API)
+# ----------------------------------------
+
+_response_cache_requests_total = None
+
+
+def get_cache_metrics():
+    global _response_cache_requests_total
+
+    with _metrics_lock:
+        if _response_cache_requests_total is None:
+            _response_cache_requests_total = Counter(
+                "response_cache_requests_total",
+                "Cached route lookups by namespace and result (hit/miss/error)",
+                ["namespace", "result"],
+            )
+
+    return {"requests": _response_cache_requests_total}
+
+
+# ----------------------------------------
+# Admission control metrics (API)
+# ----------------------------------------
+
+_job_admission_total = None
+
+
+def get_admission_metrics():
+    global _job_admission_total
+
+    with _metrics_lock:
+        if _job_admission_total is None:
+            _job_admission_total = Counter(
+                "job_admission_total",
+                "Job submissions by queue, role and result (admitted/rejected_depth/rejected_age)",
+                ["queue", "role", "result"],
+            )
+
+    return {"decisions": _job_admission_total}
+
+
 # ----------------------------------------
 # Metrics endpoint
 # ----------------------------------------
@@ -1,18 +1,29 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
 from datetime import datetime
 from app.db.database import Base
 
 class AuditEvent(Base):
     __tablename__ = "audit_events"
+    __table_args__ = (
+        # newest-first listing and keyset pagination on (timestamp, id)
+        Index("ix_audit_events_timestamp_id", "timestamp", "id"),
+        # filtered listings keep the same (timestamp, id) keyset order
+        Index("ix_audit_events_user_id_timestamp_id", "user_id", "timestamp", "id"),
+        Index("ix_audit_events_action_timestamp_id", "action", "timestamp", "id"),
+        Index("ix_audit_events_target_timestamp_id", "target", "timestamp", "id"),
+        # monthly partitions, managed by app/utils/partitions.py
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    # partition key must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, nullable=True)
     username = Column(String(100), nullable=True)
     role = Column(String(50), nullable=True)
     action = Column(String(200), nullable=False)
     target = Column(String(255), nullable=True)
     endpoint = Column(String(255), nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, primary_key=True, nullable=False, default=datetime.utcnow)
 
     # FIXED: cannot use "metadata"
     details = Column(JSON, nullable=True)
@@ -1,10 +1,18 @@
 # app/models/device.py
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from app.db.database import Base
 
 class DeviceDB(Base):
     __tablename__ = "devices"
+    __table_args__ = (
+        # platform filter in id (cursor) order
+        Index("ix_devices_platform_id", "platform", "id"),
+        # name prefix filters (LIKE 'abc%')
+        Index("ix_devices_name_pattern", "name", postgresql_ops={"name": "varchar_pattern_ops"}),
+        # one device per name: bulk import upserts ON CONFLICT (name)
+        Index("uq_devices_name", "name", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -1,11 +1,16 @@
 # app/models/job.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func
+from sqlalchemy import BigInteger, Column, Date, Float, Integer, String, Text, DateTime, ForeignKey, JSON, Index, UniqueConstraint, func, text
 from sqlalchemy.orm import relationship
 from app.models.device import DeviceDB 
 from app.db.database import Base
 
 class JobDB(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_device_id_status", "device_id", "status"),
+        # partial: the dispatcher only ever scans PENDING jobs
+        Index("ix_jobs_pending_created_at", "created_at", postgresql_where=text("status = 'PENDING'")),
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
     device_id = Column(Integer, ForeignKey("devices.id"), nullable=False)
@@ -13,11 +18,18 @@ class JobDB(Base):
     status = Column(String(50), default="PENDING")  # PENDING, RUNNING, SUCCESS, FAILED
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Incremented by the state machine when an attempt starts (attempt_no source)
+    attempt_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     attempts = relationship("JobAttempt", back_populates="job")
     logs = relationship("JobLog", back_populates="job")
+    output_chunks = relationship("JobLogChunk", back_populates="job")
 
 class JobAttempt(Base):
     __tablename__ = "job_attempts"
+    __table_args__ = (
+        Index("ix_job_attempts_job_id_attempt_no", "job_id", "attempt_no"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     attempt_no = Column(Integer, nullable=False, default=1)
@@ -25,11 +37,18 @@ class JobAttempt(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     exit_code = Column(Integer, nullable=True)
 
+    # Seconds per phase, e.g. {"connect": 1.2, "apply": 4.8}
+    phase_durations = Column(JSON, nullable=True)
+
     job = relationship("JobDB", back_populates="attempts")
     logs = relationship("JobLog", back_populates="attempt")
 
 class JobLog(Base):
     __tablename__ = "job_logs"
+    __table_args__ = (
+        Index("ix_job_logs_job_id_created_at", "job_id", "created_at"),
+        Index("ix_job_logs_attempt_id", "attempt_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
     attempt_id = Column(Integer, ForeignKey("job_attempts.id"), nullable=True)
@@ -37,5 +56,44 @@ class JobLog(Base):
     exit_code = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Large outputs: gzip blob (app/utils/blobstore.py), `output` stays NULL
+    output_blob = Column(String(255), nullable=True)
+    output_size = Column(BigInteger, nullable=True)
+    output_sha256 = Column(String(64), nullable=True)
+
     job = relationship("JobDB", back_populates="logs")
     attempt = relationship("JobAttempt", back_populates="logs")
+
+class JobLogChunk(Base):
+    """
+    Incremental job output. Appended in bounded chunks while the job runs;
+    `seq` is per job (1, 2, 3, ...) and is the offset used by tail readers.
+    """
+    __tablename__ = "job_log_chunks"
+    __table_args__ = (UniqueConstraint("job_id", "seq", name="uq_job_log_chunks_job_seq"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
+    attempt_id = Column(Integer, ForeignKey("job_attempts.id"), nullable=True)
+    seq = Column(Integer, nullable=False)
+    data = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    job = relationship("JobDB", back_populates="output_chunks")
+
+class JobStatsDaily(Base):
+    """
+    Rollup of completed attempts per (UTC day, device). Maintained by
+    finish_attempt (incremental) and reconciled by a beat task; the
+    stats API reads only this table. `platform` is copied from the
+    device so per-platform summaries need no join.
+    """
+    __tablename__ = "job_stats_daily"
+
+    day = Column(Date, primary_key=True)
+    device_id = Column(Integer, primary_key=True)
+    platform = Column(String(100), nullable=True)
+    succeeded = Column(Integer, nullable=False, default=0, server_default="0")
+    failed = Column(Integer, nullable=False, default=0, server_default="0")
+    duration_seconds_total = Column(Float, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
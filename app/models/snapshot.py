@@ -1,14 +1,19 @@
 # app/models/snapshot.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func, Text
 from app.db.database import Base
 from sqlalchemy.orm import relationship
 
 class ConfigSnapshot(Base):
     __tablename__ = "config_snapshots"
+    __table_args__ = (
+        # latest snapshot per device (backup change detection)
+        Index("ix_config_snapshots_device_id_created_at", "device_id", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     device_id = Column(Integer, ForeignKey("devices.id"), nullable=False)
     filename = Column(String(512), nullable=False)
     content = Column(Text, nullable=True)        # optional: store config in DB too
+    content_hash = Column(String(64), nullable=True, index=True)  # sha256 of config text
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     device = relationship("DeviceDB", backref="snapshots")
@@ -0,0 +1,20 @@
+# app/models/table_version.py
+
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+from app.db.database import Base
+
+
+class TableVersion(Base):
+    """
+    Per-table change counter for cheap conditional GETs (ETag).
+
+    Bumped by a statement-level trigger (bump_table_version) on every
+    INSERT/UPDATE/DELETE/TRUNCATE of a tracked table, see migration
+    f1b7c3e5a820. One PK lookup tells whether a table changed, without
+    reading its rows.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(63), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1, server_default="1")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -5,5 +5,5 @@ class UserDB(Base):
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
-    username = Column(String(50), nullable=False)
+    username = Column(String(50), nullable=False, index=True)
     role = Column(String(50), nullable=False, default="operator")
@@ -6,6 +6,9 @@ from pydantic import BaseModel
 class DeviceCreate(BaseModel):
     name: str
     ip: str
+    platform: str           # netmiko device_type, e.g. cisco_ios
+    credentials_ref: str    # Vault path with username/password
+    port: int = 22
 
 
 # ---------------------------
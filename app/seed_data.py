@@ -2,6 +2,7 @@ from app.models.job import JobDB
 from sqlalchemy.orm import Session
 from app.database import engine, Base, SessionLocal
 from app.models import Device, User, Job  # adjust these imports to your actual model names
+from app.utils.partitions import ensure_audit_partitions, ensure_default_audit_partition
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -12,6 +13,11 @@ def seed_database():
     logger.info("Creating tables (if they don't exist)...")
     Base.metadata.create_all(bind=engine)
 
+    # audit_events is partitioned: create_all makes the parent only
+    with engine.begin() as conn:
+        ensure_default_audit_partition(conn)
+        ensure_audit_partitions(conn)
+
     db: Session = SessionLocal()
     try:
         # Example default user
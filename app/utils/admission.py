@@ -0,0 +1,165 @@
+# app/utils/admission.py
+
+import json
+import logging
+import math
+import time
+from typing import Optional, Tuple
+
+import redis
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import request_role
+from app.core.config import settings
+from app.metrics import get_admission_metrics
+from app.worker.celery_app import celery_app
+
+logger = logging.getLogger("netdevops")
+
+# ==========================================================
+# ADMISSION CONTROL (QUEUE BACKPRESSURE)
+# ==========================================================
+# Job submissions are refused with 429 + Retry-After while the target
+# broker queue is too deep or its oldest message too old:
+#
+#   depth      = LLEN <queue>
+#   oldest age = now - enqueued_at of the oldest message (LINDEX -1;
+#                kombu LPUSHes and workers pop from the right)
+#
+# enqueued_at is stamped on every published task by a before_task_publish
+# hook (app/worker/celery_app.py). Messages without it (older
+# publishers) only count towards depth.
+#
+# Both limits are multiplied by the caller's role budget
+# (ADMISSION_ROLE_BUDGETS), so urgent admin pushes still get through
+# while routine submissions back off.
+#
+# Queue state is read at most every ADMISSION_CHECK_INTERVAL_SECONDS per
+# process and queue. Broker errors admit the request (fail open): the
+# enqueue itself reports a broker that is really down.
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+
+_broker_client = None
+# queue -> (checked_at, depth, oldest_age)
+_queue_state_cache: dict = {}
+
+
+def _get_broker():
+    global _broker_client
+
+    if _broker_client is None:
+        _broker_client = redis.Redis.from_url(
+            celery_app.conf.broker_url,
+            socket_timeout=1,
+            socket_connect_timeout=1,
+        )
+
+    return _broker_client
+
+
+def role_budgets() -> dict:
+    budgets = {}
+    for item in settings.ADMISSION_ROLE_BUDGETS.split(","):
+        role, _, factor = item.strip().partition(":")
+        if role and factor:
+            budgets[role] = float(factor)
+    return budgets
+
+
+def _message_age(raw: Optional[bytes], now: float) -> Optional[float]:
+    if raw is None:
+        return 0.0
+
+    try:
+        enqueued_at = json.loads(raw).get("headers", {}).get(ENQUEUED_AT_HEADER)
+    except (ValueError, AttributeError):
+        return None
+
+    return max(0.0, now - float(enqueued_at)) if enqueued_at else None
+
+
+def queue_state(queue: str) -> Tuple[int, Optional[float]]:
+    """(depth, oldest message age in seconds or None), cached briefly."""
+    checked = time.monotonic()
+    cached = _queue_state_cache.get(queue)
+    if cached and checked - cached[0] < settings.ADMISSION_CHECK_INTERVAL_SECONDS:
+        return cached[1], cached[2]
+
+    pipe = _get_broker().pipeline(transaction=False)
+    pipe.llen(queue)
+    pipe.lindex(queue, -1)
+    depth, oldest = pipe.execute()
+
+    state = (checked, depth, _message_age(oldest, time.time()))
+    _queue_state_cache[queue] = state
+    return state[1], state[2]
+
+
+def admission_decision(queue: str, role: str) -> Tuple[str, dict]:
+    """
+    Returns (result, detail): result is "admitted", "rejected_depth" or
+    "rejected_age"; detail describes the queue for the 429 body.
+    """
+    budget = role_budgets().get(role, 1.0)
+    max_depth = settings.ADMISSION_MAX_QUEUE_DEPTH * budget
+    max_age = settings.ADMISSION_MAX_QUEUE_AGE_SECONDS * budget
+
+    depth, age = queue_state(queue)
+    detail = {
+        "queue": queue,
+        "depth": depth,
+        "oldest_age_seconds": round(age, 1) if age is not None else None,
+        "max_depth": int(max_depth),
+        "max_age_seconds": max_age,
+    }
+
+    if age is not None and age > max_age:
+        return "rejected_age", detail
+    if depth >= max_depth:
+        return "rejected_depth", detail
+    return "admitted", detail
+
+
+def _retry_after(result: str, detail: dict) -> int:
+    base = settings.ADMISSION_RETRY_AFTER_SECONDS
+    if result == "rejected_age":
+        # at least until the backlog is back under the age limit
+        return max(base, math.ceil(detail["oldest_age_seconds"] - detail["max_age_seconds"]))
+    return base
+
+
+# ----------------------------------------
+# FastAPI dependency
+# ----------------------------------------
+def require_queue_capacity(queue: str):
+    """
+    Dependency for job submission routes. Usage:
+        dependencies=[Depends(require_queue_capacity("celery"))]
+    """
+    async def inner(request: Request):
+        if not settings.ADMISSION_CONTROL_ENABLED:
+            return
+
+        role = request_role(request)
+
+        try:
+            # sync Redis round trip (at most once per interval): off the event loop
+            result, detail = await run_in_threadpool(admission_decision, queue, role)
+        except Exception as e:
+            logger.warning(f"Admission check failed for queue {queue}, admitting: {e}")
+            return
+
+        get_admission_metrics()["decisions"].labels(queue, role, result).inc()
+
+        if result != "admitted":
+            retry_after = _retry_after(result, detail)
+            logger.info(f"Job submission rejected ({result}, role={role}): {detail}")
+            raise HTTPException(
+                status_code=429,
+                detail={"reason": result, **detail},
+                headers={"Retry-After": str(retry_after)},
+            )
+
+    return inner
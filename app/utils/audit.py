@@ -6,6 +6,7 @@ from fastapi import Request, Depends
 from app.db.database import SessionLocal
 from app.models.audit import AuditEvent
 from app.api.deps import get_current_user
+from app.utils.response_cache import invalidate_cache
 
 
 def audit(action: str, target: str = None):
@@ -29,6 +30,7 @@ def audit(action: str, target: str = None):
 
             db.add(event)
             db.commit()
+            await invalidate_cache("audit")
 
             return await func(*args, request=request, **kwargs)
 
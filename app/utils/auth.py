@@ -3,8 +3,9 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
+from app.db.database import SessionLocal, AsyncSessionLocal
 from app.models.user import UserDB
 from app.db.database import get_db
 from app.core.security import verify_password, get_password_hash
@@ -50,7 +51,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
 # -------------------------------
 # 👤 User Authentication
 # -------------------------------
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """Validate JWT token and return current user"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -60,9 +61,8 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication token")
 
-    db: Session = SessionLocal()
-    user = db.query(UserDB).filter(UserDB.username == username).first()
-    db.close()
+    async with AsyncSessionLocal() as db:
+        user = (await db.scalars(select(UserDB).where(UserDB.username == username).limit(1))).first()
 
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
@@ -0,0 +1,97 @@
+# app/utils/blobstore.py
+
+import gzip
+import hashlib
+import os
+import re
+import threading
+from typing import BinaryIO, Iterator, NamedTuple
+
+from app.core.config import settings
+
+# ==========================================================
+# LOCAL BLOB STORE (gzip, content-addressed)
+# ==========================================================
+# Large job outputs are stored as  <BLOB_STORE_DIR>/<sha[:2]>/<sha>.gz
+# and the database only keeps the key, the uncompressed size and the
+# sha256. Identical outputs (same running-config twice) share one file.
+# BLOB_STORE_DIR must be shared by workers (write) and the API (read).
+
+_KEY_RE = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{64}\.gz$")
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class BlobRef(NamedTuple):
+    key: str
+    sha256: str
+    size: int
+
+
+def blob_path(key: str) -> str:
+    # keys only ever come from put_blob(), but never trust a path blindly
+    if not _KEY_RE.match(key):
+        raise ValueError(f"Invalid blob key: {key!r}")
+
+    return os.path.join(settings.BLOB_STORE_DIR, key)
+
+
+def put_blob(data: bytes) -> BlobRef:
+    sha = hashlib.sha256(data).hexdigest()
+    key = f"{sha[:2]}/{sha}.gz"
+    path = blob_path(key)
+
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Atomic write, tmp name unique per process/thread (same as snapshots)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as fh:
+            fh.write(data)
+
+        os.replace(tmp_path, path)
+
+    return BlobRef(key=key, sha256=sha, size=len(data))
+
+
+def put_blob_file(src: BinaryIO) -> BlobRef:
+    """
+    put_blob() for content read from a file object (from its current
+    position): hashed and compressed chunk by chunk, never fully in memory.
+    The key is only known at the end, so the tmp file lives in the root.
+    """
+    os.makedirs(settings.BLOB_STORE_DIR, exist_ok=True)
+    tmp_path = os.path.join(settings.BLOB_STORE_DIR, f".put.{os.getpid()}.{threading.get_ident()}.tmp")
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(tmp_path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) as fh:
+            while True:
+                chunk = src.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+                fh.write(chunk)
+
+        sha = digest.hexdigest()
+        key = f"{sha[:2]}/{sha}.gz"
+        path = blob_path(key)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return BlobRef(key=key, sha256=sha, size=size)
+
+
+def iter_blob(key: str, chunk_size: int = READ_CHUNK_BYTES) -> Iterator[bytes]:
+    """Decompressed content, chunk by chunk (never fully in memory)."""
+    with gzip.open(blob_path(key), "rb") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
@@ -2,9 +2,12 @@
 
 import os
 import logging
+import threading
+import time
 import traceback
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from netmiko import (
     ConnectHandler,
@@ -12,6 +15,8 @@ from netmiko import (
     NetMikoAuthenticationException,
 )
 
+from app.metrics import get_metrics
+
 # ============================
 # Logging
 # ============================
@@ -25,6 +30,37 @@ MAX_SNAPSHOT_SIZE = 5 * 1024 * 1024  # 5MB
 
 os.makedirs(SNAPSHOT_DIR, exist_ok=True)
 
+# ============================
+# Phase Timing
+# ============================
+class PhaseTimer:
+    """
+    Times the phases of one job attempt.
+    Each phase is observed in job_phase_duration_seconds{phase=...} and
+    accumulated in `durations` (seconds) for persistence on the attempt.
+    """
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed
+            get_metrics(scope="worker")["phase_duration"].labels(phase=name).observe(elapsed)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: round(value, 3) for name, value in self.durations.items()}
+
+
+def _phase(timer: Optional[PhaseTimer], name: str):
+    return timer.phase(name) if timer else nullcontext()
+
+
 # ============================
 # Snapshot Helpers
 # ============================
@@ -42,8 +78,9 @@ def save_snapshot_to_fs(device_id: int, text: str) -> str:
         fname = snapshot_filename(device_id)
         path = os.path.abspath(os.path.join(SNAPSHOT_DIR, fname))
 
-        # Atomic write
-        tmp_path = f"{path}.tmp"
+        # Atomic write (tmp name unique per process/thread: thread-pool
+        # workers can snapshot the same device within the same second)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
         with open(tmp_path, "w", encoding="utf-8") as fh:
             fh.write(text)
 
@@ -77,21 +114,27 @@ def build_conn_args(device) -> dict:
     return args
 
 
+def _connect(device, timer: Optional[PhaseTimer] = None):
+    conn_args = build_conn_args(device)
+
+    with _phase(timer, "connect"):
+        return ConnectHandler(**conn_args)
+
+
 # ============================
 # Fetch Config
 # ============================
-def fetch_running_config(device) -> Tuple[int, str]:
+def fetch_running_config(device, timer: Optional[PhaseTimer] = None) -> Tuple[int, str]:
     try:
-        conn_args = build_conn_args(device)
-
-        with ConnectHandler(**conn_args) as conn:
+        with _connect(device, timer) as conn:
             command = (
                 "show running-config"
                 if "cisco" in device.platform.lower()
                 else "show configuration"
             )
 
-            text = conn.send_command(command)
+            with _phase(timer, "snapshot_fetch"):
+                text = conn.send_command(command)
             logger.info(f"Fetched config for device {device.id}")
 
             return 0, text
@@ -108,12 +151,15 @@ def fetch_running_config(device) -> Tuple[int, str]:
 # ============================
 # Apply Config
 # ============================
-def apply_config(device, config_lines: List[str]) -> Tuple[int, str]:
+def apply_config(
+    device,
+    config_lines: List[str],
+    timer: Optional[PhaseTimer] = None,
+) -> Tuple[int, str]:
     try:
-        conn_args = build_conn_args(device)
-
-        with ConnectHandler(**conn_args) as conn:
-            output = conn.send_config_set(config_lines)
+        with _connect(device, timer) as conn:
+            with _phase(timer, "apply"):
+                output = conn.send_config_set(config_lines)
 
         logger.info(f"Config applied to device {device.id}")
         return 0, output
@@ -130,16 +176,19 @@ def apply_config(device, config_lines: List[str]) -> Tuple[int, str]:
 # ============================
 # Verify Config
 # ============================
-def verify_config(device, verify_commands: List[str]) -> Tuple[bool, str]:
+def verify_config(
+    device,
+    verify_commands: List[str],
+    timer: Optional[PhaseTimer] = None,
+) -> Tuple[bool, str]:
     outputs = []
 
     try:
-        conn_args = build_conn_args(device)
-
-        with ConnectHandler(**conn_args) as conn:
-            for cmd in verify_commands:
-                out = conn.send_command(cmd)
-                outputs.append(f"$ {cmd}\n{out}\n")
+        with _connect(device, timer) as conn:
+            with _phase(timer, "verify"):
+                for cmd in verify_commands:
+                    out = conn.send_command(cmd)
+                    outputs.append(f"$ {cmd}\n{out}\n")
 
         combined = "\n".join(outputs)
 
@@ -159,7 +208,11 @@ def verify_config(device, verify_commands: List[str]) -> Tuple[bool, str]:
 # ============================
 # Rollback
 # ============================
-def rollback_from_snapshot(device, snapshot_path: str) -> Tuple[int, str]:
+def rollback_from_snapshot(
+    device,
+    snapshot_path: str,
+    timer: Optional[PhaseTimer] = None,
+) -> Tuple[int, str]:
     try:
         if not os.path.exists(snapshot_path):
             raise FileNotFoundError(snapshot_path)
@@ -169,7 +222,9 @@ def rollback_from_snapshot(device, snapshot_path: str) -> Tuple[int, str]:
 
         logger.warning(f"Rollback triggered for device {device.id}")
 
-        return apply_config(device, lines)
+        # Whole rollback (connect + re-apply) counts as one phase
+        with _phase(timer, "rollback"):
+            return apply_config(device, lines)
 
     except Exception as e:
         logger.error(f"Rollback failed: {e}")
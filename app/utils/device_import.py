@@ -0,0 +1,230 @@
+# app/utils/device_import.py
+
+import csv
+from typing import AsyncIterator, List
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ==========================================================
+# BULK DEVICE IMPORT (COPY -> staging -> set-based upsert)
+# ==========================================================
+# 1. COPY the request body into a temp staging table (all text columns,
+#    so COPY itself never fails on a bad value). row_no is an identity
+#    column, i.e. the data row number in the file.
+#      csv    : Postgres parses the CSV; columns come from the header
+#      ndjson : each line lands in `doc` untouched (quote/delimiter are
+#               control chars that never occur in JSON text)
+# 2. One UPDATE validates every row and records `error`.
+# 3. One INSERT ... ON CONFLICT (name) upserts all valid rows
+#    (uq_devices_name, migration c6d2e8a4f153).
+#
+# Rows with errors are reported back; they never abort the batch.
+#
+# Validation uses input_is_valid() (migration a9e3d1f7c462):
+# pg_input_is_valid() on PostgreSQL 16+, a trapped cast on 15.
+
+STAGE_TABLE = "device_import_stage"
+IMPORT_COLUMNS = ("name", "ip", "platform", "credentials_ref", "port")
+REQUIRED_COLUMNS = ("name", "ip", "platform", "credentials_ref")
+MAX_REPORTED_ERRORS = 1000
+
+# serializes imports: overlapping batches would otherwise lock the same
+# name index entries in different orders and deadlock
+IMPORT_LOCK_KEY = "device_import"
+
+CREATE_STAGE_SQL = text(f"""
+CREATE TEMP TABLE {STAGE_TABLE} (
+    row_no          bigint GENERATED ALWAYS AS IDENTITY,
+    name            text,
+    ip              text,
+    platform        text,
+    credentials_ref text,
+    port            text,
+    doc             text,
+    error           text
+) ON COMMIT DROP
+""")
+
+# ndjson: unpack the JSON document into the typed-as-text columns
+UNPACK_NDJSON_SQL = text(f"""
+UPDATE {STAGE_TABLE}
+SET name            = doc::jsonb ->> 'name',
+    ip              = doc::jsonb ->> 'ip',
+    platform        = doc::jsonb ->> 'platform',
+    credentials_ref = doc::jsonb ->> 'credentials_ref',
+    port            = doc::jsonb ->> 'port'
+WHERE CASE WHEN input_is_valid(doc, 'jsonb') THEN jsonb_typeof(doc::jsonb) = 'object' ELSE false END
+""")
+
+DROP_BLANK_NDJSON_SQL = text(f"DELETE FROM {STAGE_TABLE} WHERE doc IS NULL OR btrim(doc) = ''")
+
+# first failing rule wins; CASE order guarantees casts only see valid input
+VALIDATE_SQL = text(f"""
+UPDATE {STAGE_TABLE} s
+SET error = v.error
+FROM (
+    SELECT row_no,
+        CASE
+            WHEN doc IS NOT NULL AND NOT input_is_valid(doc, 'jsonb') THEN 'invalid JSON'
+            WHEN doc IS NOT NULL AND jsonb_typeof(doc::jsonb) <> 'object' THEN 'JSON value is not an object'
+            WHEN coalesce(btrim(name), '') = '' THEN 'name is required'
+            WHEN length(name) > 255 THEN 'name is longer than 255 characters'
+            WHEN coalesce(btrim(ip), '') = '' THEN 'ip is required'
+            WHEN NOT input_is_valid(btrim(ip), 'inet') THEN 'ip is not a valid address'
+            WHEN coalesce(btrim(platform), '') = '' THEN 'platform is required'
+            WHEN length(platform) > 100 THEN 'platform is longer than 100 characters'
+            WHEN coalesce(btrim(credentials_ref), '') = '' THEN 'credentials_ref is required'
+            WHEN length(credentials_ref) > 255 THEN 'credentials_ref is longer than 255 characters'
+            WHEN coalesce(btrim(port), '') = '' THEN NULL
+            WHEN NOT input_is_valid(btrim(port), 'integer') THEN 'port is not an integer'
+            WHEN btrim(port)::integer NOT BETWEEN 1 AND 65535 THEN 'port is out of range'
+        END AS error
+    FROM {STAGE_TABLE}
+) v
+WHERE s.row_no = v.row_no AND v.error IS NOT NULL
+""")
+
+# same name twice in one file: the last row wins, earlier ones are reported
+FLAG_DUPLICATES_SQL = text(f"""
+UPDATE {STAGE_TABLE} s
+SET error = 'duplicate name in file (row ' || d.last_row || ' wins)'
+FROM (
+    SELECT row_no,
+           max(row_no) OVER (PARTITION BY btrim(name)) AS last_row
+    FROM {STAGE_TABLE}
+    WHERE error IS NULL
+) d
+WHERE s.row_no = d.row_no AND d.row_no <> d.last_row
+""")
+
+# xmax = 0 only on freshly inserted row versions
+UPSERT_SQL = text(f"""
+WITH upserted AS (
+    INSERT INTO devices (name, ip, platform, credentials_ref, port)
+    SELECT btrim(name),
+           btrim(ip),
+           btrim(platform),
+           btrim(credentials_ref),
+           coalesce(nullif(btrim(port), '')::integer, 22)
+    FROM {STAGE_TABLE}
+    WHERE error IS NULL
+    ON CONFLICT (name) DO UPDATE
+    SET ip = excluded.ip,
+        platform = excluded.platform,
+        credentials_ref = excluded.credentials_ref,
+        port = excluded.port
+    RETURNING (xmax = 0) AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted)     AS inserted,
+       count(*) FILTER (WHERE NOT inserted) AS updated
+FROM upserted
+""")
+
+SUMMARY_SQL = text(f"SELECT count(*) AS received, count(error) AS failed FROM {STAGE_TABLE}")
+
+ERRORS_SQL = text(f"""
+SELECT row_no, error FROM {STAGE_TABLE}
+WHERE error IS NOT NULL
+ORDER BY row_no
+LIMIT {MAX_REPORTED_ERRORS}
+""")
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+# ----------------------------------------
+# Request body helpers
+# ----------------------------------------
+async def split_csv_header(stream: AsyncIterator[bytes]):
+    """
+    Read just enough of the body for the header line.
+    Returns (columns, source) where source yields the remaining bytes.
+    """
+    buffered = b""
+    async for chunk in stream:
+        buffered += chunk
+        if b"\n" in buffered:
+            break
+
+    header, _, rest = buffered.partition(b"\n")
+    header_text = header.decode("utf-8-sig").strip()
+    if not header_text:
+        raise ImportFormatError("CSV header row is missing")
+
+    columns = [c.strip().lower() for c in next(csv.reader([header_text]))]
+    validate_columns(columns)
+
+    async def source():
+        if rest:
+            yield rest
+        async for chunk in stream:
+            yield chunk
+
+    return columns, source()
+
+
+def validate_columns(columns: List[str]):
+    unknown = [c for c in columns if c not in IMPORT_COLUMNS]
+    if unknown:
+        raise ImportFormatError(f"Unknown CSV columns: {', '.join(unknown)}")
+
+    if len(set(columns)) != len(columns):
+        raise ImportFormatError("Duplicate CSV columns")
+
+    missing = [c for c in REQUIRED_COLUMNS if c not in columns]
+    if missing:
+        raise ImportFormatError(f"Missing CSV columns: {', '.join(missing)}")
+
+
+# ----------------------------------------
+# Import
+# ----------------------------------------
+async def import_devices(db: AsyncSession, fmt: str, stream: AsyncIterator[bytes]) -> dict:
+    """
+    Stream the body through COPY and upsert. Commits on success.
+    `fmt` is "csv" or "ndjson".
+    """
+    if fmt == "csv":
+        columns, source = await split_csv_header(stream)
+        copy_options = {"columns": columns, "format": "csv"}
+    else:
+        source = stream
+        copy_options = {"columns": ["doc"], "format": "csv", "delimiter": "\x02", "quote": "\x01"}
+
+    await db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": IMPORT_LOCK_KEY})
+    await db.execute(CREATE_STAGE_SQL)
+
+    # COPY needs the driver connection (asyncpg), same transaction
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    try:
+        await raw.driver_connection.copy_to_table(STAGE_TABLE, source=source, **copy_options)
+    except asyncpg.PostgresError as e:
+        # malformed CSV framing (e.g. unterminated quote, extra columns)
+        raise ImportFormatError(f"COPY failed: {e}")
+
+    if fmt == "ndjson":
+        await db.execute(DROP_BLANK_NDJSON_SQL)
+        await db.execute(UNPACK_NDJSON_SQL)
+
+    await db.execute(VALIDATE_SQL)
+    await db.execute(FLAG_DUPLICATES_SQL)
+
+    counts = (await db.execute(UPSERT_SQL)).one()
+    summary = (await db.execute(SUMMARY_SQL)).one()
+    errors = (await db.execute(ERRORS_SQL)).all()
+
+    await db.commit()
+
+    return {
+        "received": summary.received,
+        "inserted": counts.inserted,
+        "updated": counts.updated,
+        "failed": summary.failed,
+        "errors": [{"row": e.row_no, "error": e.error} for e in errors],
+        "errors_truncated": summary.failed > len(errors),
+    }
@@ -0,0 +1,68 @@
+# app/utils/etag.py
+
+import hashlib
+
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.table_version import TableVersion
+
+# ==========================================================
+# ETAGS / CONDITIONAL GET
+# ==========================================================
+# Strong ETags built from a cheap version source (a table_versions
+# counter, a file digest) plus the request's query string, so the
+# "nothing changed" answer costs one PK lookup and no row reads:
+#
+#     version = await table_version(db, "devices")
+#     etag = make_etag("devices", version, request.url.query) if version is not None else None
+#     if etag and etag_matches(request, etag):
+#         return not_modified(etag)
+#     ...
+#     if etag:
+#         response.headers.update(etag_headers(etag))
+#
+# No version row (table not tracked, migration not applied): no ETag
+# at all, every request is a plain 200.
+#
+# Read the version BEFORE the rows: a concurrent write can then only
+# make the body newer than its tag (next request gets a 200), never
+# older.
+
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+async def table_version(db: AsyncSession, table_name: str) -> Optional[int]:
+    """Current version counter, None when the table is not tracked."""
+    return await db.scalar(
+        select(TableVersion.version).where(TableVersion.table_name == table_name)
+    )
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
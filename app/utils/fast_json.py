@@ -0,0 +1,72 @@
+# app/utils/fast_json.py
+
+import json
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.engine import Row, RowMapping
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json fallback
+    orjson = None
+
+logger = logging.getLogger("netdevops")
+
+# ==========================================================
+# FAST JSON RESPONSES
+# ==========================================================
+# FastJSONResponse renders with orjson (when installed) and understands
+# SQLAlchemy rows directly, so list endpoints can return
+#
+#     FastJSONResponse({"items": result.mappings().all()})
+#
+# Returning a Response instance also skips FastAPI's jsonable_encoder
+# pass, which walks every value of large payloads in Python.
+# Enabled app-wide as the default response class (FAST_JSON_ENABLED).
+
+
+def _default(obj: Any):
+    if isinstance(obj, RowMapping):
+        return dict(obj)
+    if isinstance(obj, Row):
+        return dict(obj._mapping)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # stdlib fallback only (orjson handles these natively)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+if orjson is not None:
+    def json_dumps(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def json_dumps(content: Any) -> bytes:
+        return json.dumps(
+            content,
+            default=_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def serializer_name() -> str:
+    return "orjson" if orjson is not None else "json"
@@ -0,0 +1,160 @@
+# app/utils/job_events.py
+
+import json
+import logging
+import time
+from typing import AsyncIterator
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.job import JobDB, JobLogChunk
+from app.utils.fast_json import json_dumps
+
+logger = logging.getLogger("netdevops")
+
+# ==========================================================
+# LIVE JOB EVENTS (REDIS PUB/SUB -> SSE)
+# ==========================================================
+# Job transitions and output chunks are published on a per-job channel
+# and relayed to clients as server-sent events (GET /v1/jobs/{id}/events),
+# so waiting for a job no longer means polling the database:
+#
+#   {"type": "status", "job_id": 1, "status": "QUEUED" | "RUNNING" | "SUCCESS" | "FAILED"}
+#   {"type": "chunk",  "job_id": 1, "seq": 3, "attempt_id": 7, "data": "..."}
+#
+# Pub/sub does not keep messages: the stream subscribes FIRST, then
+# replays the current status and job_log_chunks from the primary, and
+# drops live chunks it already sent (by seq). Clients resume with the
+# standard Last-Event-ID header (= last chunk seq).
+#
+# Publishing is best effort: a Redis hiccup never fails a job.
+
+JOB_EVENTS_CHANNEL_PREFIX = "job-events:"
+TERMINAL_STATUSES = {"SUCCESS", "FAILED"}
+REPLAY_BATCH_ROWS = 100
+SSE_RETRY_MS = 3000
+
+_redis_client = None
+_async_redis_client = None
+
+
+def job_channel(job_id: int) -> str:
+    return f"{JOB_EVENTS_CHANNEL_PREFIX}{job_id}"
+
+
+# ----------------------------------------
+# Publisher side (workers / enqueue, sync)
+# ----------------------------------------
+def _get_redis():
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+
+    return _redis_client
+
+
+def publish_job_event(job_id: int, event: dict):
+    if not settings.JOB_EVENTS_ENABLED:
+        return
+
+    try:
+        _get_redis().publish(job_channel(job_id), json_dumps(event))
+    except Exception as e:
+        logger.warning(f"Job {job_id}: event publish failed: {e}")
+
+
+def publish_status(job_id: int, status: str, **extra):
+    publish_job_event(job_id, {"type": "status", "job_id": job_id, "status": status, **extra})
+
+
+def publish_chunk(job_id: int, seq: int, attempt_id, data: str):
+    publish_job_event(job_id, {
+        "type": "chunk",
+        "job_id": job_id,
+        "seq": seq,
+        "attempt_id": attempt_id,
+        "data": data,
+    })
+
+
+# ----------------------------------------
+# Subscriber side (API, async)
+# ----------------------------------------
+def _get_async_redis():
+    global _async_redis_client
+
+    # one connection pool per API process; each stream holds one connection
+    if _async_redis_client is None:
+        _async_redis_client = aioredis.Redis.from_url(settings.REDIS_URL)
+
+    return _async_redis_client
+
+
+def sse_message(event: str, data: dict, event_id=None) -> bytes:
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    # json_dumps output is single-line: one data field per event
+    return f"{head}event: {event}\ndata: ".encode() + json_dumps(data) + b"\n\n"
+
+
+async def stream_job_events(session_factory, job_id: int, after: int = 0) -> AsyncIterator[bytes]:
+    """
+    SSE body for one job: replay (status + chunks with seq > after), then
+    live events until the job reaches a terminal status. Heartbeat
+    comments keep proxies from closing an idle stream.
+    """
+    pubsub = _get_async_redis().pubsub()
+    await pubsub.subscribe(job_channel(job_id))
+
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n".encode()
+
+        # subscribed before reading: nothing can fall between the two
+        last_seq = after
+        async with session_factory() as db:
+            status = await db.scalar(select(JobDB.status).where(JobDB.id == job_id))
+
+            replay = await db.stream(
+                select(JobLogChunk.seq, JobLogChunk.attempt_id, JobLogChunk.data)
+                .where(JobLogChunk.job_id == job_id, JobLogChunk.seq > after)
+                .order_by(JobLogChunk.seq)
+                .execution_options(yield_per=REPLAY_BATCH_ROWS)
+            )
+            async for row in replay:
+                yield sse_message("chunk", {"job_id": job_id, **row._mapping}, row.seq)
+                last_seq = row.seq
+
+        yield sse_message("status", {"job_id": job_id, "status": status})
+        if status in TERMINAL_STATUSES:
+            return
+
+        deadline = time.monotonic() + settings.JOB_EVENTS_MAX_STREAM_SECONDS
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=settings.JOB_EVENTS_HEARTBEAT_SECONDS,
+            )
+            if message is None:
+                yield b": keepalive\n\n"
+                continue
+
+            event = json.loads(message["data"])
+            kind = event.pop("type", None)
+
+            if kind == "chunk":
+                if event["seq"] <= last_seq:
+                    continue
+                last_seq = event["seq"]
+                yield sse_message("chunk", event, event["seq"])
+
+            elif kind == "status":
+                yield sse_message("status", event)
+                if event["status"] in TERMINAL_STATUSES:
+                    return
+
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
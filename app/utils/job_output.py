@@ -0,0 +1,127 @@
+# app/utils/job_output.py
+
+import logging
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.job import JobLogChunk
+from app.utils.job_events import publish_chunk
+
+logger = logging.getLogger("netdevops.worker")
+
+
+class JobOutputWriter:
+    """
+    Appends job output to job_log_chunks while the job runs.
+
+    - Output is buffered up to JOB_OUTPUT_CHUNK_CHARS, then flushed as one
+      row, so worker memory stays bounded for long outputs.
+    - Flushes use their own short session and commit immediately: readers
+      see output before the job's own transaction finishes.
+    - Each committed chunk is also published as a live job event.
+
+    Usage:
+        with JobOutputWriter(job_id, attempt_id) as out:
+            out.write("...")
+    """
+
+    def __init__(self, job_id: int, attempt_id: Optional[int] = None, chunk_chars: Optional[int] = None):
+        self.job_id = job_id
+        self.attempt_id = attempt_id
+        self.chunk_chars = chunk_chars or settings.JOB_OUTPUT_CHUNK_CHARS
+        self._buffer = []
+        self._buffered = 0
+        self._next_seq = None
+
+    # ----------------------------------------
+    # Public API
+    # ----------------------------------------
+    def write(self, text: str):
+        if not text:
+            return
+
+        self._buffer.append(text)
+        self._buffered += len(text)
+
+        if self._buffered >= self.chunk_chars:
+            self._flush(final=False)
+
+    def flush(self):
+        self._flush(final=True)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.close()
+        except Exception as e:
+            # losing streamed output must never fail the job itself
+            logger.error(f"Job {self.job_id}: output flush failed: {e}")
+        return False
+
+    # ----------------------------------------
+    # Internals
+    # ----------------------------------------
+    def _take_chunks(self, final: bool):
+        data = "".join(self._buffer)
+        size = self.chunk_chars
+
+        full = len(data) - (len(data) % size)
+        chunks = [data[i:i + size] for i in range(0, full, size)]
+        rest = data[full:]
+
+        if final and rest:
+            chunks.append(rest)
+            rest = ""
+
+        self._buffer = [rest] if rest else []
+        self._buffered = len(rest)
+        return chunks
+
+    def _flush(self, final: bool):
+        chunks = self._take_chunks(final)
+        if not chunks:
+            return
+
+        db = SessionLocal()
+        try:
+            if self._next_seq is None:
+                last = db.scalar(
+                    select(func.max(JobLogChunk.seq)).where(JobLogChunk.job_id == self.job_id)
+                )
+                self._next_seq = (last or 0) + 1
+
+            rows = []
+            published = []
+            for data in chunks:
+                rows.append(
+                    JobLogChunk(
+                        job_id=self.job_id,
+                        attempt_id=self.attempt_id,
+                        seq=self._next_seq,
+                        data=data,
+                    )
+                )
+                published.append((self._next_seq, data))
+                self._next_seq += 1
+
+            db.add_all(rows)
+            db.commit()
+
+            # local values: committed rows are expired (no refresh queries)
+            for seq, data in published:
+                publish_chunk(self.job_id, seq, self.attempt_id, data)
+
+        except Exception:
+            db.rollback()
+            raise
+
+        finally:
+            db.close()
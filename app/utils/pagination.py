@@ -0,0 +1,29 @@
+# app/utils/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+
+# ==========================================================
+# KEYSET CURSORS
+# ==========================================================
+# Cursors are opaque to clients: urlsafe base64 of the last row's
+# (timestamp, id). The next page is `WHERE (ts, id) < (cursor)`, which
+# walks the (ts, id) index instead of counting past an OFFSET.
+
+
+def encode_cursor(ts: datetime, row_id: int) -> str:
+    raw = json.dumps({"t": ts.isoformat(), "i": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["t"]), int(data["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
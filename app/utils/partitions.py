@@ -0,0 +1,130 @@
+# app/utils/partitions.py
+
+import logging
+import re
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+
+logger = logging.getLogger("netdevops.worker")
+
+# ==========================================================
+# AUDIT EVENT PARTITIONS
+# ==========================================================
+# audit_events is RANGE-partitioned on timestamp, one partition per
+# month (audit_events_pYYYYMM) plus audit_events_default as a safety
+# net. Partitions are created ahead of time; retention detaches and
+# drops whole months instead of DELETEing rows.
+
+AUDIT_TABLE = "audit_events"
+AUDIT_DEFAULT_PARTITION = "audit_events_default"
+_PARTITION_RE = re.compile(r"^audit_events_p(\d{4})(\d{2})$")
+
+
+def month_start(dt: datetime) -> datetime:
+    return datetime(dt.year, dt.month, 1)
+
+
+def add_months(dt: datetime, months: int) -> datetime:
+    index = dt.year * 12 + (dt.month - 1) + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{AUDIT_TABLE}_p{month:%Y%m}"
+
+
+def ensure_default_audit_partition(conn: Connection):
+    """
+    Create audit_events_default if missing. Tables created outside
+    migrations (metadata.create_all) have no partitions at all, and a
+    partitioned table without one rejects every insert.
+    """
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {AUDIT_DEFAULT_PARTITION} PARTITION OF {AUDIT_TABLE} DEFAULT"
+    ))
+
+
+def ensure_audit_partitions(conn: Connection, now: datetime | None = None, ahead: int | None = None) -> List[str]:
+    """
+    Create the current month's partition and `ahead` future ones.
+    Returns the names of the partitions that were created.
+    """
+    now = now or datetime.utcnow()
+    ahead = settings.AUDIT_PARTITIONS_AHEAD if ahead is None else ahead
+    current = month_start(now)
+
+    existing = set(list_audit_partitions(conn))
+    created = []
+
+    for i in range(ahead + 1):
+        lower = add_months(current, i)
+        name = partition_name(lower)
+        if name in existing:
+            continue
+
+        try:
+            # savepoint: one bad month (e.g. rows already in the default
+            # partition for that range) must not abort the others
+            with conn.begin_nested():
+                conn.execute(text(
+                    f"CREATE TABLE {name} PARTITION OF {AUDIT_TABLE} "
+                    f"FOR VALUES FROM ('{lower:%Y-%m-%d}') TO ('{add_months(lower, 1):%Y-%m-%d}')"
+                ))
+            created.append(name)
+        except DBAPIError as e:
+            logger.error(f"Could not create audit partition {name}: {e}")
+
+    return created
+
+
+def list_audit_partitions(conn: Connection) -> List[str]:
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = CAST(:parent AS regclass) "
+        "ORDER BY c.relname"
+    ), {"parent": AUDIT_TABLE}).scalars().all()
+
+    return list(rows)
+
+
+def drop_expired_audit_partitions(
+    conn: Connection,
+    now: datetime | None = None,
+    retention_months: int | None = None,
+) -> List[str]:
+    """
+    Detach and drop monthly partitions that end before the retention
+    cutoff. Old rows that landed in the default partition are deleted.
+    Returns the names of the dropped partitions.
+    """
+    now = now or datetime.utcnow()
+    retention_months = settings.AUDIT_RETENTION_MONTHS if retention_months is None else retention_months
+    cutoff = add_months(month_start(now), -retention_months)
+
+    dropped = []
+    for name in list_audit_partitions(conn):
+        match = _PARTITION_RE.match(name)
+        if not match:
+            continue
+
+        lower = datetime(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(lower, 1) > cutoff:
+            continue
+
+        conn.execute(text(f"ALTER TABLE {AUDIT_TABLE} DETACH PARTITION {name}"))
+        conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+
+    conn.execute(
+        text(f"DELETE FROM {AUDIT_DEFAULT_PARTITION} WHERE timestamp < :cutoff"),
+        {"cutoff": cutoff},
+    )
+
+    return dropped
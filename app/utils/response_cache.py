@@ -0,0 +1,193 @@
+# app/utils/response_cache.py
+
+import hashlib
+import inspect
+import json
+import logging
+from functools import wraps
+
+import redis
+import redis.asyncio as aioredis
+from fastapi import Request, Response
+
+from app.api.deps import request_role
+from app.core.config import settings
+from app.metrics import get_cache_metrics
+from app.utils.etag import etag_matches, not_modified
+from app.utils.fast_json import FastJSONResponse, json_dumps
+
+logger = logging.getLogger("netdevops")
+
+# ==========================================================
+# RESPONSE CACHE (REDIS)
+# ==========================================================
+# @cached_response("devices") stores a route's 200 responses in Redis,
+# keyed by path + sorted query string + caller role:
+#
+#     cache:<namespace>:<generation>:<sha256(path?query|role)>
+#
+# Entries expire after RESPONSE_CACHE_TTL_SECONDS. Writes invalidate a
+# whole namespace by bumping its generation (invalidate_cache /
+# invalidate_cache_sync): older keys are never read again and age out,
+# so no SCAN/DEL over the keyspace, and a fill that raced a write lands
+# under the old generation.
+#
+# Namespaces: devices, jobs, audit. Changes made outside the app
+# (psql, migrations) only show up after the TTL.
+#
+# Redis errors never fail a request: the route just runs uncached.
+
+CACHE_KEY_PREFIX = "cache:"
+GENERATION_KEY_PREFIX = "cache-gen:"
+# response headers replayed on a hit (content-type comes from media_type)
+CACHED_HEADERS = ("etag", "cache-control")
+
+_redis_client = None
+_async_redis_client = None
+
+
+def _redis_options() -> dict:
+    timeout = settings.RESPONSE_CACHE_TIMEOUT_SECONDS
+    return {"socket_timeout": timeout, "socket_connect_timeout": timeout}
+
+
+def _get_redis():
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL, **_redis_options())
+
+    return _redis_client
+
+
+def _get_async_redis():
+    global _async_redis_client
+
+    if _async_redis_client is None:
+        _async_redis_client = aioredis.Redis.from_url(settings.REDIS_URL, **_redis_options())
+
+    return _async_redis_client
+
+
+# ----------------------------------------
+# Keys / entries
+# ----------------------------------------
+def cache_key(namespace: str, generation: str, request: Request) -> str:
+    query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    digest = hashlib.sha256(f"{request.url.path}?{query}|{request_role(request)}".encode("utf-8")).hexdigest()
+    return f"{CACHE_KEY_PREFIX}{namespace}:{generation}:{digest}"
+
+
+def _pack(response: Response) -> bytes:
+    meta = {
+        "status": response.status_code,
+        "media_type": response.media_type,
+        "headers": {k: v for k, v in response.headers.items() if k in CACHED_HEADERS},
+    }
+    # json_dumps is single-line: first line is metadata, the rest the body
+    return json_dumps(meta) + b"\n" + response.body
+
+
+def _unpack(data: bytes) -> Response:
+    meta, _, body = data.partition(b"\n")
+    meta = json.loads(meta)
+    return Response(
+        content=body,
+        status_code=meta["status"],
+        media_type=meta["media_type"],
+        headers=meta["headers"],
+    )
+
+
+# ----------------------------------------
+# Route decorator
+# ----------------------------------------
+def cached_response(namespace: str, ttl: int | None = None):
+    """
+    Cache a GET route's successful responses. Place it under the
+    @router.get decorator. The route gets a `request` parameter if it
+    does not declare one.
+    """
+    def decorator(endpoint):
+        signature = inspect.signature(endpoint)
+        has_request = "request" in signature.parameters
+
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request = kwargs["request"] if has_request else kwargs.pop("request")
+
+            if not settings.RESPONSE_CACHE_ENABLED:
+                return await endpoint(*args, **kwargs)
+
+            requests_total = get_cache_metrics()["requests"]
+            client = _get_async_redis()
+
+            try:
+                generation = await client.get(f"{GENERATION_KEY_PREFIX}{namespace}")
+                key = cache_key(namespace, (generation or b"0").decode(), request)
+                cached = await client.get(key)
+            except Exception as e:
+                logger.warning(f"Response cache unavailable ({namespace}): {e}")
+                requests_total.labels(namespace, "error").inc()
+                return await endpoint(*args, **kwargs)
+
+            if cached is not None:
+                requests_total.labels(namespace, "hit").inc()
+                response = _unpack(cached)
+
+                etag = response.headers.get("etag")
+                if etag and etag_matches(request, etag):
+                    return not_modified(etag)
+
+                response.headers["X-Cache"] = "HIT"
+                return response
+
+            requests_total.labels(namespace, "miss").inc()
+            response = await endpoint(*args, **kwargs)
+            if not isinstance(response, Response):
+                response = FastJSONResponse(response)
+
+            # 200s with a body only: never 304s, errors or streams
+            body = getattr(response, "body", None)
+            if response.status_code == 200 and body is not None and len(body) <= settings.RESPONSE_CACHE_MAX_BYTES:
+                try:
+                    await client.set(key, _pack(response), ex=ttl or settings.RESPONSE_CACHE_TTL_SECONDS)
+                except Exception as e:
+                    logger.warning(f"Response cache store failed ({namespace}): {e}")
+
+            response.headers["X-Cache"] = "MISS"
+            return response
+
+        if not has_request:
+            request_param = inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+            wrapper.__signature__ = signature.replace(
+                parameters=[*signature.parameters.values(), request_param]
+            )
+
+        return wrapper
+    return decorator
+
+
+# ----------------------------------------
+# Invalidation (write paths)
+# ----------------------------------------
+async def invalidate_cache(*namespaces: str):
+    try:
+        pipe = _get_async_redis().pipeline(transaction=False)
+        for namespace in namespaces:
+            pipe.incr(f"{GENERATION_KEY_PREFIX}{namespace}")
+        await pipe.execute()
+    except Exception as e:
+        # entries still expire after RESPONSE_CACHE_TTL_SECONDS
+        logger.warning(f"Response cache invalidation failed {namespaces}: {e}")
+
+
+def invalidate_cache_sync(*namespaces: str):
+    """Worker-side invalidate_cache (sync Redis client)."""
+    try:
+        pipe = _get_redis().pipeline(transaction=False)
+        for namespace in namespaces:
+            pipe.incr(f"{GENERATION_KEY_PREFIX}{namespace}")
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed {namespaces}: {e}")
@@ -1,5 +1,7 @@
 # app/utils/secrets.py
 import os
+import threading
+import time
 import requests
 
 # Keep this module free of top-level imports from core.config to avoid circular imports.
@@ -7,9 +9,36 @@ import requests
 
 def _get_vault_settings():
     # lazy import to avoid circular import
-    from core.config import settings
+    from app.core.config import settings
     return settings
 
+
+# Short-lived in-process cache: device credentials are read on every job,
+# and workers pre-fetch hot secrets at startup (app/worker/warmup.py).
+_secret_cache: dict = {}
+_secret_cache_lock = threading.Lock()
+
+
+def get_secret_cached(path: str, key: str | None = None) -> dict | str:
+    """
+    get_secret() with a per-process TTL cache (SECRET_CACHE_TTL_SECONDS).
+    A TTL of 0 disables caching.
+    """
+    ttl = _get_vault_settings().SECRET_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return get_secret(path, key)
+
+    now = time.monotonic()
+    with _secret_cache_lock:
+        hit = _secret_cache.get((path, key))
+    if hit and hit[0] > now:
+        return hit[1]
+
+    value = get_secret(path, key)
+    with _secret_cache_lock:
+        _secret_cache[(path, key)] = (now + ttl, value)
+    return value
+
 def get_secret(path: str, key: str | None = None) -> dict | str:
     """
     Fetch a secret from Vault (or return from env if Vault isn't configured).
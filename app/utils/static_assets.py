@@ -0,0 +1,55 @@
+# app/utils/static_assets.py
+
+import mimetypes
+import os
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+
+# ==========================================================
+# PRECOMPRESSED STATIC ASSETS
+# ==========================================================
+# scripts/build_static.py writes app/static/dist/ at image build time
+# (copies, .gz siblings, manifest.json).
+#
+# PrecompressedStaticFiles serves the .gz sibling as-is to clients that
+# accept gzip, so nothing is compressed per request. Assets are entry
+# pages with fixed URLs: no-cache, revalidated through ETag /
+# Last-Modified (304 while unchanged).
+#
+# Without a build (local dev) the plain source files are served.
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+BUILD_DIR = "dist"
+MANIFEST_FILE = "manifest.json"
+
+
+def static_build_dir(source_dir: str) -> str:
+    build_dir = os.path.join(source_dir, BUILD_DIR)
+    return build_dir if os.path.isfile(os.path.join(build_dir, MANIFEST_FILE)) else source_dir
+
+
+class PrecompressedStaticFiles(StaticFiles):
+
+    async def get_response(self, path: str, scope):
+        if "gzip" in Headers(scope=scope).get("accept-encoding", ""):
+            try:
+                response = await super().get_response(f"{path}.gz", scope)
+            except HTTPException:
+                response = None
+
+            if response is not None:
+                media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                if media_type.startswith("text/"):
+                    media_type += "; charset=utf-8"
+                response.headers["Content-Type"] = media_type
+                response.headers["Content-Encoding"] = "gzip"
+                # identity responses get theirs from GZipMiddleware
+                response.headers.add_vary_header("Accept-Encoding")
+                response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+                return response
+
+        response = await super().get_response(path, scope)
+        response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        return response
@@ -0,0 +1,141 @@
+# app/worker/backup.py
+
+import hashlib
+import logging
+import time
+import zlib
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.device import DeviceDB
+from app.models.snapshot import ConfigSnapshot
+from app.utils.deploy import fetch_running_config, save_snapshot_to_fs
+from app.utils.secrets import get_secret_cached as get_secret
+from app.worker.celery_app import celery_app
+
+logger = logging.getLogger("netdevops.worker")
+
+
+# ==========================================================
+# SLOTTING
+# ==========================================================
+# The backup window is split into fixed slots. Every device is pinned
+# to one slot by a stable hash of its id, and beat fires the sweep once
+# per slot. Each tick therefore only dispatches ~fleet/slots devices,
+# so load stays flat as the fleet grows (no "everything at 02:00").
+
+def slot_count() -> int:
+    return max(1, settings.BACKUP_WINDOW_SECONDS // settings.BACKUP_SLOT_SECONDS)
+
+
+def device_slot(device_id: int, slots: int) -> int:
+    # crc32: stable across processes (unlike hash()) and cheap
+    return zlib.crc32(f"device:{device_id}".encode()) % slots
+
+
+def current_slot(slots: int, now: float | None = None) -> int:
+    now = time.time() if now is None else now
+    return int(now // settings.BACKUP_SLOT_SECONDS) % slots
+
+
+def _chunks(items: List[int], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# ==========================================================
+# SWEEP (BEAT, ONCE PER SLOT)
+# ==========================================================
+@celery_app.task(name="app.worker.backup.fleet_backup_sweep")
+def fleet_backup_sweep():
+    if not settings.BACKUP_SWEEP_ENABLED:
+        return {"status": "DISABLED"}
+
+    slots = slot_count()
+    slot = current_slot(slots)
+
+    db: Session = SessionLocal()
+    try:
+        device_ids = db.scalars(select(DeviceDB.id).order_by(DeviceDB.id)).all()
+    finally:
+        db.close()
+
+    due = [d for d in device_ids if device_slot(d, slots) == slot]
+
+    chunks = 0
+    for chunk in _chunks(due, settings.BACKUP_CHUNK_SIZE):
+        backup_device_chunk.apply_async(
+            args=[chunk],
+            queue=settings.BACKUP_QUEUE,
+            # a chunk that waited a whole window is superseded by the next sweep
+            expires=settings.BACKUP_WINDOW_SECONDS,
+        )
+        chunks += 1
+
+    logger.info(f"Backup sweep slot {slot}/{slots}: {len(due)} devices in {chunks} chunks")
+    return {"slot": slot, "slots": slots, "devices": len(due), "chunks": chunks}
+
+
+# ==========================================================
+# CHUNK WORKER (DEDICATED QUEUE)
+# ==========================================================
+@celery_app.task(name="app.worker.backup.backup_device_chunk")
+def backup_device_chunk(device_ids: List[int]):
+    """
+    Back up devices one after another (one SSH session per task).
+    A snapshot is only written when the config hash differs from the
+    device's latest snapshot.
+    """
+    result = {"saved": 0, "unchanged": 0, "failed": 0}
+
+    db: Session = SessionLocal(expire_on_commit=False)
+    try:
+        devices = db.scalars(select(DeviceDB).where(DeviceDB.id.in_(device_ids))).all()
+
+        for device in devices:
+            try:
+                outcome = _backup_device(db, device)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Backup failed for device {device.id}: {e}")
+                outcome = "failed"
+
+            result[outcome] += 1
+
+    finally:
+        db.close()
+
+    return result
+
+
+def _backup_device(db: Session, device: DeviceDB) -> str:
+    creds = get_secret(device.credentials_ref) if device.credentials_ref else {}
+    device.username = creds.get("username")
+    device.password = creds.get("password")
+
+    code, running_config = fetch_running_config(device)
+    if code != 0:
+        return "failed"
+
+    content_hash = hashlib.sha256(running_config.encode("utf-8")).hexdigest()
+
+    last_hash = db.scalar(
+        select(ConfigSnapshot.content_hash)
+        .where(ConfigSnapshot.device_id == device.id)
+        .order_by(ConfigSnapshot.created_at.desc(), ConfigSnapshot.id.desc())
+        .limit(1)
+    )
+
+    if last_hash == content_hash:
+        return "unchanged"
+
+    path = save_snapshot_to_fs(device.id, running_config)
+
+    db.add(ConfigSnapshot(device_id=device.id, filename=path, content_hash=content_hash))
+    db.commit()
+
+    return "saved"
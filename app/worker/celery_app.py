@@ -2,6 +2,7 @@
 
 import logging
 import os
+import tempfile
 import time
 import traceback
 from datetime import datetime
@@ -9,9 +10,12 @@ from typing import List, Optional
 
 
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import before_task_publish, task_revoked, worker_init, worker_process_init, worker_ready
 from sqlalchemy.orm import Session
 from celery.exceptions import MaxRetriesExceededError 
 from app.metrics import get_metrics 
+from app.core.config import settings
 
 logger = logging.getLogger("netdevops.worker")
 
@@ -35,25 +39,63 @@ celery_app.conf.update(
     task_routes={
         "app.worker.celery_app.test_task": {"queue": "celery"},
         "app.worker.celery_app.placeholder_job": {"queue": "celery"},
-        "app.worker.celery_app.push_config_job": {"queue": "celery"},
+        "app.worker.celery_app.push_config_job": {"queue": settings.DEVICE_IO_QUEUE},
+        "app.worker.celery_app.io_probe_task": {"queue": settings.DEVICE_IO_QUEUE},
         "app.worker.celery_app.fail_task": {"queue": "celery"},
+        "app.worker.backup.fleet_backup_sweep": {"queue": "celery"},
+        "app.worker.backup.backup_device_chunk": {"queue": settings.BACKUP_QUEUE},
+        "app.worker.maintenance.audit_partition_maintenance": {"queue": "celery"},
+        "app.worker.maintenance.reconcile_job_stats_task": {"queue": "celery"},
     },
     task_soft_time_limit=300,
     task_time_limit=600,
+    # warm-up runs inside worker_process_init (default limit: 4s)
+    worker_proc_alive_timeout=settings.WORKER_WARMUP_TIMEOUT_SECONDS + 10,
+    # Staggered fleet backup: one sweep per slot (see app/worker/backup.py)
+    beat_schedule={
+        "fleet-backup-sweep": {
+            "task": "app.worker.backup.fleet_backup_sweep",
+            "schedule": float(settings.BACKUP_SLOT_SECONDS),
+        },
+        # Monthly audit_events partitions: create ahead, drop expired
+        "audit-partition-maintenance": {
+            "task": "app.worker.maintenance.audit_partition_maintenance",
+            "schedule": crontab(hour=0, minute=15),
+        },
+        # job_stats_daily: rebuild recent days from job_attempts
+        "job-stats-reconcile": {
+            "task": "app.worker.maintenance.reconcile_job_stats_task",
+            "schedule": float(settings.JOB_STATS_RECONCILE_SECONDS),
+        },
+    },
 )
 
+# ==========================================================
+# PUBLISH TIMESTAMP (ADMISSION CONTROL)
+# ==========================================================
+# Oldest-message age of a queue is read from this header by the API
+# (app/utils/admission.py).
+@before_task_publish.connect
+def _stamp_enqueued_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
+
+
 # ==========================================================
 # CRITICAL :FORCE TASK REGISTRATION
 # ==========================================================
 import app.worker.tasks 
+import app.worker.backup
+import app.worker.maintenance
 
 
 # ==========================================================
 # IMPORTS
 # ==========================================================
 from app.db.database import SessionLocal
-from app.utils.secrets import get_secret
+from app.utils.secrets import get_secret_cached as get_secret
 from app.utils.deploy import (
+    PhaseTimer,
     fetch_running_config,
     save_snapshot_to_fs,
     apply_config,
@@ -62,6 +104,36 @@ from app.utils.deploy import (
 )
 from app.models.job import JobDB, JobAttempt
 from app.models.device import DeviceDB
+from app.worker.payloads import pack_payload, resolve_payload
+from app.worker.job_state import expire_queued_run, finish_attempt
+from app.utils.blobstore import put_blob_file
+from app.utils.job_output import JobOutputWriter
+from app.utils.job_events import publish_status
+from app.utils.response_cache import invalidate_cache_sync
+from app.worker.health import start_health_server
+from app.worker.warmup import warm_up_worker
+
+
+# ==========================================================
+# WORKER LIFECYCLE (WARM-UP + HEALTH)
+# ==========================================================
+@worker_init.connect
+def _on_worker_init(**kwargs):
+    start_health_server()
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs):
+    # prefork child: warm up before the first task
+    warm_up_worker()
+
+
+@worker_ready.connect
+def _on_worker_ready(sender=None, **kwargs):
+    # threads/solo pools run tasks in the main process (no process_init)
+    pool = getattr(sender, "pool", None)
+    if pool is None or not type(pool).__module__.endswith("prefork"):
+        warm_up_worker()
 
 # ==========================================================
 # TEST TASK
@@ -113,23 +185,91 @@ def placeholder_job(self, job_id: int):
 # ==========================================================
 # PRODUCTION JOB
 # ==========================================================
+class _PushOutput:
+    """
+    Output of one push attempt. Each phase (header + device output) is
+    written through JobOutputWriter as it completes, so the tail API and
+    live events see all of it, and spooled for the final job log: in
+    memory up to JOB_OUTPUT_INLINE_MAX_BYTES, a temp file beyond that.
+    """
+
+    def __init__(self, job_id: int, attempt_id: int):
+        self.live = JobOutputWriter(job_id, attempt_id)
+        self.spool = tempfile.SpooledTemporaryFile(max_size=settings.JOB_OUTPUT_INLINE_MAX_BYTES)
+
+    def phase(self, header: str, output: str = ""):
+        text = f"### {header}\n{output}\n" if output else f"### {header}\n"
+        self.live.write(text)
+        # appended even after final() read it (the failure path adds a phase)
+        self.spool.seek(0, os.SEEK_END)
+        self.spool.write(text.encode("utf-8"))
+
+    def final(self):
+        """(output, None) to store inline, (None, blob) when offloaded."""
+        size = self.spool.seek(0, os.SEEK_END)
+        self.spool.seek(0)
+
+        if size > settings.JOB_OUTPUT_INLINE_MAX_BYTES:
+            return None, put_blob_file(self.spool)
+
+        return self.spool.read().decode("utf-8"), None
+
+    def close(self):
+        self.spool.close()
+
+
+def _complete_attempt(
+    db: Session,
+    job_id: int,
+    attempt_id: int,
+    status: str,
+    exit_code: int,
+    out: _PushOutput,
+):
+    """
+    Final status for push_config_job (any outcome): live output is
+    flushed first, then finish_attempt completes the attempt, records
+    the full output (inline, or the blob streamed from the spool) and
+    the stats rollup, commits, and only then publishes the status.
+    The chunks are already written, so no final chunk is appended.
+    """
+    try:
+        out.live.close()
+    except Exception as e:
+        logger.error(f"Job {job_id}: output flush failed: {e}")
+
+    output, blob = out.final()
+    finish_attempt(db, job_id, attempt_id, status, exit_code, output, blob=blob, append_chunk=False)
+
+
 @celery_app.task(bind=True, name="app.worker.celery_app.push_config_job")
 def push_config_job(
     self,
     job_id: int,
     attempt_id: int,
-    config_lines: Optional[List[str]],
-    verify_commands: Optional[List[str]] = None,
+    config_lines: Optional[List[str] | dict],
+    verify_commands: Optional[List[str] | dict] = None,
 ):
     metrics = get_metrics(scope="worker")
 
     # 🔒 HARD GUARD
     assert "pushed" not in metrics
 
-    db: Session = SessionLocal()
+    # expire_on_commit=False: after the RUNNING commit the connection goes
+    # back to the pool and is NOT re-acquired to refresh attributes, so no
+    # DB connection is held while waiting on SSH (thread-pool workers).
+    db: Session = SessionLocal(expire_on_commit=False)
     start_time = time.time()
+    timer = PhaseTimer()
+    attempt = None
+    out = None
+    completed = False
 
     try:
+        # Claim-check: args may be inline lists or payload references ({"$ref": ...})
+        config_lines = resolve_payload(config_lines)
+        verify_commands = resolve_payload(verify_commands)
+
         job = db.query(JobDB).filter(JobDB.id == job_id).one_or_none()
         attempt = db.query(JobAttempt).filter(JobAttempt.id == attempt_id).one_or_none()
 
@@ -149,44 +289,152 @@ def push_config_job(
         job.status = "RUNNING"
         attempt.started_at = datetime.utcnow()
         db.commit()
+        invalidate_cache_sync("jobs")
+        publish_status(job_id, "RUNNING", attempt_id=attempt_id)
+
+        # Output is streamed phase by phase and spooled for the job log
+        out = _PushOutput(job_id, attempt_id)
 
-        code, running_config = fetch_running_config(device)
+        code, running_config = fetch_running_config(device, timer)
         if code != 0:
+            out.phase(f"snapshot failed (exit {code})", running_config)
+            _complete_attempt(db, job_id, attempt_id, "FAILED", code, out)
+            completed = True
             metrics["failed"].inc()
             return {"status": "FAILED", "reason": "snapshot_failed"}
 
         snapshot_path = save_snapshot_to_fs(device.id, running_config)
+        out.phase(f"snapshot saved: {snapshot_path}")
 
-        apply_exit, _ = apply_config(device, config_lines or [])
+        apply_exit, apply_output = apply_config(device, config_lines or [], timer)
+        out.phase(f"apply (exit {apply_exit})", apply_output)
         if apply_exit != 0:
-            rollback_from_snapshot(device, snapshot_path)
+            rb_exit, rb_output = rollback_from_snapshot(device, snapshot_path, timer)
+            out.phase(f"rollback (exit {rb_exit})", rb_output)
+            _complete_attempt(db, job_id, attempt_id, "FAILED", apply_exit, out)
+            completed = True
             metrics["failed"].inc()
             return {"status": "FAILED", "reason": "apply_failed"}
 
-        ok, _ = verify_config(device, verify_commands or [])
+        ok, verify_output = verify_config(device, verify_commands or [], timer)
+        out.phase(f"verify ({'ok' if ok else 'failed'})", verify_output)
         if not ok:
-            rollback_from_snapshot(device, snapshot_path)
+            rb_exit, rb_output = rollback_from_snapshot(device, snapshot_path, timer)
+            out.phase(f"rollback (exit {rb_exit})", rb_output)
+            _complete_attempt(db, job_id, attempt_id, "FAILED", 1, out)
+            completed = True
             metrics["failed"].inc()
             return {"status": "FAILED", "reason": "verify_failed"}
 
-        job.status = "SUCCESS"
-        attempt.completed_at = datetime.utcnow()
-        attempt.exit_code = 0
-        db.commit()
+        _complete_attempt(db, job_id, attempt_id, "SUCCESS", 0, out)
+        completed = True
 
         metrics["success"].inc()
         return {"status": "SUCCESS"}
 
     except Exception as e:
         logger.error(traceback.format_exc())
+
+        # RUNNING was committed (output exists) but never completed,
+        # including when finish_attempt itself failed
+        if out is not None and not completed:
+            try:
+                db.rollback()
+                out.phase(f"error: {e}")
+                _complete_attempt(db, job_id, attempt_id, "FAILED", 1, out)
+            except Exception:
+                db.rollback()
+
         metrics["failed"].inc()
         return {"status": "FAILED", "error": str(e)}
 
     finally:
         metrics["duration"].observe(time.time() - start_time)
+
+        # Persist per-phase timings on the attempt (success or failure)
+        if attempt is not None and timer.durations:
+            try:
+                attempt.phase_durations = timer.as_dict()
+                db.commit()
+            except Exception:
+                db.rollback()
+
+        if out is not None:
+            out.close()
+        db.close()
+
+
+def enqueue_push_config(
+    job_id: int,
+    attempt_id: int,
+    config_lines: Optional[List[str]],
+    verify_commands: Optional[List[str]] = None,
+):
+    """
+    Enqueue push_config_job with large payloads sent by reference.
+    Bulk rollouts of the same config store the payload only once.
+    """
+    result = push_config_job.apply_async(
+        args=[
+            job_id,
+            attempt_id,
+            pack_payload(config_lines),
+            pack_payload(verify_commands),
+        ],
+        # a push still queued this long is stale: workers discard it
+        expires=settings.JOB_QUEUE_EXPIRES_SECONDS,
+    )
+    publish_status(job_id, "QUEUED", attempt_id=attempt_id)
+    return result
+
+
+# ==========================================================
+# EXPIRED JOB MESSAGES
+# ==========================================================
+# run_job / push_config_job are sent with expires=JOB_QUEUE_EXPIRES_SECONDS.
+# A worker that receives one too late revokes it without running it;
+# the job is then failed here so its status (and live streams) do not
+# wait on a run that will never happen.
+EXPIRING_JOB_TASKS = {
+    "app.worker.tasks.run_job",
+    "app.worker.celery_app.push_config_job",
+}
+
+
+@task_revoked.connect
+def _on_task_revoked(sender=None, request=None, expired=False, **kwargs):
+    if not expired or request is None or getattr(sender, "name", None) not in EXPIRING_JOB_TASKS:
+        return
+
+    # push_config_job(job_id, attempt_id, ...) / run_job(job_id)
+    job_id = request.args[0]
+    attempt_id = request.args[1] if sender.name == push_config_job.name else None
+    logger.warning(f"Job {job_id}: queue message expired, marking FAILED")
+
+    db: Session = SessionLocal()
+    try:
+        expire_queued_run(db, job_id, attempt_id)
+        get_metrics(scope="worker")["failed"].inc()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Job {job_id}: could not record expiry: {e}")
+    finally:
         db.close()
 
 
+# ==========================================================
+# I/O PROBE TASK (POOL BENCHMARK)
+# ==========================================================
+@celery_app.task(name="app.worker.celery_app.io_probe_task")
+def io_probe_task(hold_seconds: float = 30.0):
+    """
+    Simulates a device session: one idle socket wait, no CPU.
+    Used by scripts/bench_worker_pool.py to compare pool modes.
+    """
+    time.sleep(hold_seconds)
+    return {"status": "OK", "pid": os.getpid()}
+
+
 # ==========================================================
 # FAILURE TASK (CRITICAL FOR GATE 5)
 # ==========================================================
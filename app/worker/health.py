@@ -0,0 +1,132 @@
+# app/worker/health.py
+
+import json
+import logging
+import os
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from prometheus_client import CollectorRegistry, multiprocess, generate_latest, CONTENT_TYPE_LATEST
+
+from app.core.config import settings
+
+logger = logging.getLogger("netdevops.worker")
+
+# ==========================================================
+# WORKER HEALTH ENDPOINT
+# ==========================================================
+# Served from the worker main process on WORKER_HEALTH_PORT:
+#   /health/live   -> process is up
+#   /health/ready  -> at least one task-executing process finished warm-up
+#   /metrics       -> multiprocess Prometheus metrics (ServiceMonitor)
+#
+# Task processes (prefork children) report readiness by dropping a
+# marker file named after their PID into WORKER_STATE_DIR.
+
+_server = None
+
+
+def _ready_dir():
+    return os.path.join(settings.WORKER_STATE_DIR, "ready")
+
+
+def reset_ready_state():
+    shutil.rmtree(_ready_dir(), ignore_errors=True)
+    os.makedirs(_ready_dir(), exist_ok=True)
+
+
+def mark_process_ready(pid: int):
+    os.makedirs(_ready_dir(), exist_ok=True)
+    with open(os.path.join(_ready_dir(), str(pid)), "w", encoding="utf-8") as fh:
+        fh.write("ready")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+def ready_processes():
+    try:
+        entries = os.listdir(_ready_dir())
+    except FileNotFoundError:
+        return []
+
+    pids = []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        pid = int(entry)
+        if _pid_alive(pid):
+            pids.append(pid)
+        else:
+            # replaced child (max-tasks-per-child, crash): forget it
+            try:
+                os.remove(os.path.join(_ready_dir(), entry))
+            except FileNotFoundError:
+                pass
+
+    return sorted(pids)
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+
+    def _send(self, code: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health/live":
+            self._send(200, json.dumps({"status": "alive"}).encode())
+
+        elif self.path == "/health/ready":
+            pids = ready_processes()
+            status = "ready" if pids else "warming_up"
+            self._send(
+                200 if pids else 503,
+                json.dumps({"status": status, "ready_processes": len(pids)}).encode(),
+            )
+
+        elif self.path == "/metrics":
+            registry = CollectorRegistry()
+            if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+                multiprocess.MultiProcessCollector(registry)
+            self._send(200, generate_latest(registry), CONTENT_TYPE_LATEST)
+
+        else:
+            self._send(404, b'{"detail": "Not Found"}')
+
+    def log_message(self, format, *args):
+        # probes every few seconds: keep them out of the worker log
+        pass
+
+
+def start_health_server():
+    global _server
+
+    if _server is not None:
+        return _server
+
+    reset_ready_state()
+
+    try:
+        _server = ThreadingHTTPServer(("0.0.0.0", settings.WORKER_HEALTH_PORT), _HealthHandler)
+    except OSError as e:
+        # e.g. a second worker on the same host (docker-compose): no endpoint
+        logger.warning(f"Worker health endpoint not started: {e}")
+        return None
+
+    thread = threading.Thread(target=_server.serve_forever, name="worker-health", daemon=True)
+    thread.start()
+
+    logger.info(f"Worker health endpoint on :{settings.WORKER_HEALTH_PORT}")
+    return _server
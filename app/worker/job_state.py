@@ -0,0 +1,207 @@
+# app/worker/job_state.py
+
+from typing import Tuple
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job import JobDB, JobAttempt, JobLog, JobLogChunk
+from app.utils.blobstore import BlobRef, put_blob
+from app.utils.job_events import publish_chunk, publish_status
+from app.utils.response_cache import invalidate_cache_sync
+from app.worker.job_stats import attempt_stats_select, increment_stats
+
+# ==========================================================
+# JOB STATE MACHINE
+# ==========================================================
+# Each transition is ONE statement (data-modifying CTEs) + commit:
+#
+#   begin_attempt : PENDING/FAILED/...  -> RUNNING   (+ new job_attempts row)
+#   finish_attempt: RUNNING             -> SUCCESS | FAILED
+#                   (+ attempt completed, job_logs row, final output chunk,
+#                    job_stats_daily rollup)
+#   expire_queued_run: queued run never started (message expired) -> FAILED
+#
+# Both publish the transition (and the final output chunk) as live job
+# events after their commit (app/utils/job_events.py) and invalidate the
+# "jobs" response cache namespace.
+#
+# attempt_no comes from jobs.attempt_count, incremented in the same
+# UPDATE, so no count() over job_attempts and no refresh round trip.
+# Core tables are used on purpose: no ORM identity map / flush involved.
+
+jobs = JobDB.__table__
+attempts = JobAttempt.__table__
+logs = JobLog.__table__
+chunks = JobLogChunk.__table__
+
+
+def begin_attempt(db: Session, job_id: int) -> Tuple[int, int]:
+    """
+    Mark the job RUNNING and create its next attempt.
+    Returns (attempt_id, attempt_no). Raises ValueError if the job does not exist.
+    """
+    job = (
+        update(jobs)
+        .where(jobs.c.id == job_id)
+        .values(status="RUNNING", attempt_count=jobs.c.attempt_count + 1)
+        .returning(jobs.c.id, jobs.c.attempt_count)
+        .cte("j")
+    )
+
+    stmt = (
+        insert(attempts)
+        .from_select(
+            ["job_id", "attempt_no", "started_at"],
+            select(job.c.id, job.c.attempt_count, func.now()),
+        )
+        .add_cte(job)
+        .returning(attempts.c.id, attempts.c.attempt_no)
+    )
+
+    row = db.execute(stmt).first()
+    if row is None:
+        db.rollback()
+        raise ValueError(f"Job {job_id} not found")
+
+    db.commit()
+    invalidate_cache_sync("jobs")
+    publish_status(job_id, "RUNNING", attempt_id=row.id, attempt_no=row.attempt_no)
+    return row.id, row.attempt_no
+
+
+def finish_attempt(
+    db: Session,
+    job_id: int,
+    attempt_id: int,
+    status: str,
+    exit_code: int,
+    output: str | None = None,
+    blob: BlobRef | None = None,
+    append_chunk: bool = True,
+):
+    """
+    Complete the attempt, set the final job status and record the log,
+    all in one statement and one transaction. A non-empty `output` is
+    also appended as the job's last output chunk (tail API).
+
+    Outputs above JOB_OUTPUT_INLINE_MAX_BYTES are written to the blob
+    store first; the log row and the tail chunk then only reference it.
+    Callers that already stored the output pass `blob` instead, and
+    callers that streamed it (JobOutputWriter) pass append_chunk=False.
+    """
+    if blob is None:
+        encoded = output.encode("utf-8") if output else b""
+        if len(encoded) > settings.JOB_OUTPUT_INLINE_MAX_BYTES:
+            blob = put_blob(encoded)
+
+    log_values = {"output": output}
+    chunk_data = output
+
+    if blob is not None:
+        log_values = {
+            "output": None,
+            "output_blob": blob.key,
+            "output_size": blob.size,
+            "output_sha256": blob.sha256,
+        }
+        chunk_data = f"[output stored as blob: {blob.size} bytes, sha256 {blob.sha256}]\n"
+
+    if not append_chunk:
+        chunk_data = None
+
+    attempt_done = (
+        update(attempts)
+        .where(attempts.c.id == attempt_id)
+        .values(completed_at=func.now(), exit_code=exit_code)
+        .returning(attempts.c.job_id, attempts.c.started_at, attempts.c.completed_at, attempts.c.exit_code)
+        .cte("a")
+    )
+
+    # rollup fed from the RETURNING above (same statement, same snapshot)
+    stats_done = increment_stats(attempt_stats_select(attempt_done)).cte("s")
+
+    job_done = (
+        update(jobs)
+        .where(jobs.c.id == job_id)
+        .values(status=status)
+        .cte("j")
+    )
+
+    stmt = (
+        insert(logs)
+        .values(job_id=job_id, attempt_id=attempt_id, exit_code=exit_code, **log_values)
+        .add_cte(attempt_done)
+        .add_cte(job_done)
+        .add_cte(stats_done)
+    )
+
+    if chunk_data:
+        next_seq = (
+            select(func.coalesce(func.max(chunks.c.seq), 0) + 1)
+            .where(chunks.c.job_id == job_id)
+            .scalar_subquery()
+        )
+        final_chunk = (
+            insert(chunks)
+            .values(job_id=job_id, attempt_id=attempt_id, seq=next_seq, data=chunk_data)
+            .returning(chunks.c.seq)
+            .cte("c")
+        )
+        stmt = stmt.add_cte(final_chunk).returning(select(final_chunk.c.seq).scalar_subquery())
+
+    result = db.execute(stmt)
+    chunk_seq = result.scalar() if chunk_data else None
+    db.commit()
+    invalidate_cache_sync("jobs")
+
+    if chunk_seq is not None:
+        publish_chunk(job_id, chunk_seq, attempt_id, chunk_data)
+    publish_status(job_id, status, attempt_id=attempt_id, exit_code=exit_code)
+
+
+EXPIRED_EXIT_CODE = 124  # timeout(1) convention
+
+
+def expire_queued_run(db: Session, job_id: int, attempt_id: int | None = None):
+    """
+    A run whose queue message expired (JOB_QUEUE_EXPIRES_SECONDS) before
+    any worker started it: mark the job FAILED with a log saying so.
+
+    push_config_job has a pre-created attempt, completed as failed via
+    finish_attempt. run_job creates its attempt only when it starts, so
+    there is none: the job is failed only if it is still QUEUED (written
+    by run_job_async), never after another run started or finished it.
+    """
+    message = f"Expired in queue: not started within {settings.JOB_QUEUE_EXPIRES_SECONDS}s\n"
+
+    if attempt_id is not None:
+        finish_attempt(db, job_id, attempt_id, "FAILED", EXPIRED_EXIT_CODE, message)
+        return
+
+    job_failed = (
+        update(jobs)
+        .where(jobs.c.id == job_id, jobs.c.status == "QUEUED")
+        .values(status="FAILED")
+        .returning(jobs.c.id)
+        .cte("j")
+    )
+
+    stmt = (
+        insert(logs)
+        .from_select(
+            ["job_id", "exit_code", "output"],
+            select(job_failed.c.id, literal(EXPIRED_EXIT_CODE), literal(message)),
+        )
+        .add_cte(job_failed)
+        .returning(logs.c.id)
+    )
+
+    row = db.execute(stmt).first()
+    db.commit()
+    if row is None:
+        return
+
+    invalidate_cache_sync("jobs")
+    publish_status(job_id, "FAILED", exit_code=EXPIRED_EXIT_CODE, reason="expired")
@@ -0,0 +1,107 @@
+# app/worker/job_stats.py
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Date, case, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.device import DeviceDB
+from app.models.job import JobDB, JobAttempt, JobStatsDaily
+
+# ==========================================================
+# JOB STATS ROLLUP (job_stats_daily)
+# ==========================================================
+# One row per (UTC day, device). An attempt counts on the day it
+# completed: exit_code 0 = succeeded, anything else = failed.
+#
+#   increment_stats()     : ON CONFLICT upsert that adds one attempt,
+#                           used inside finish_attempt's statement
+#   record_attempt_stats(): same, for an already-committed attempt
+#   reconcile_job_stats() : rebuild the last N days from job_attempts
+#                           (repairs attempts completed outside both)
+
+stats = JobStatsDaily.__table__
+jobs = JobDB.__table__
+attempts = JobAttempt.__table__
+devices = DeviceDB.__table__
+
+STATS_COLUMNS = ["day", "device_id", "platform", "succeeded", "failed", "duration_seconds_total"]
+
+
+def _utc_day(ts):
+    return cast(func.timezone("UTC", ts), Date)
+
+
+def attempt_stats_select(attempt):
+    """(day, device_id, platform, succeeded, failed, duration) for attempt rows/CTE `attempt`."""
+    return (
+        select(
+            _utc_day(attempt.c.completed_at),
+            jobs.c.device_id,
+            devices.c.platform,
+            case((attempt.c.exit_code == 0, 1), else_=0),
+            case((attempt.c.exit_code == 0, 0), else_=1),
+            func.coalesce(func.extract("epoch", attempt.c.completed_at - attempt.c.started_at), 0),
+        )
+        .select_from(attempt)
+        .join(jobs, jobs.c.id == attempt.c.job_id)
+        .join(devices, devices.c.id == jobs.c.device_id)
+    )
+
+
+def increment_stats(source):
+    stmt = pg_insert(stats).from_select(STATS_COLUMNS, source)
+    return stmt.on_conflict_do_update(
+        index_elements=[stats.c.day, stats.c.device_id],
+        set_={
+            "platform": stmt.excluded.platform,
+            "succeeded": stats.c.succeeded + stmt.excluded.succeeded,
+            "failed": stats.c.failed + stmt.excluded.failed,
+            "duration_seconds_total": stats.c.duration_seconds_total + stmt.excluded.duration_seconds_total,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def record_attempt_stats(db: Session, attempt_id: int):
+    """Add one completed (committed) attempt to the rollup. Caller commits."""
+    source = attempt_stats_select(attempts).where(
+        attempts.c.id == attempt_id,
+        attempts.c.completed_at.is_not(None),
+    )
+    db.execute(increment_stats(source))
+
+
+def reconcile_job_stats(db: Session, days: int) -> int:
+    """
+    Recompute the rollup for the last `days` UTC days (today included)
+    from job_attempts, in one transaction. Returns the number of rows.
+    """
+    since = (datetime.utcnow() - timedelta(days=days - 1)).date()
+    since_ts = datetime(since.year, since.month, since.day, tzinfo=timezone.utc)
+
+    per_attempt = (
+        attempt_stats_select(attempts)
+        .where(attempts.c.completed_at >= since_ts)
+        .subquery()
+    )
+    day, device_id, platform, succeeded, failed, duration = per_attempt.c
+
+    rebuilt = (
+        select(
+            day,
+            device_id,
+            func.max(platform),
+            func.sum(succeeded),
+            func.sum(failed),
+            func.sum(duration),
+        )
+        .group_by(day, device_id)
+    )
+
+    db.execute(delete(stats).where(stats.c.day >= since))
+    result = db.execute(pg_insert(stats).from_select(STATS_COLUMNS, rebuilt))
+    db.commit()
+
+    return result.rowcount
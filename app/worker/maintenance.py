@@ -0,0 +1,51 @@
+# app/worker/maintenance.py
+
+import logging
+
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+from app.utils.partitions import drop_expired_audit_partitions, ensure_audit_partitions
+from app.utils.response_cache import invalidate_cache_sync
+from app.worker.celery_app import celery_app
+from app.worker.job_stats import reconcile_job_stats
+
+logger = logging.getLogger("netdevops.worker")
+
+
+# ==========================================================
+# AUDIT PARTITIONS (BEAT, DAILY)
+# ==========================================================
+@celery_app.task(name="app.worker.maintenance.audit_partition_maintenance")
+def audit_partition_maintenance():
+    if not settings.AUDIT_PARTITION_MAINTENANCE_ENABLED:
+        return {"status": "DISABLED"}
+
+    with engine.begin() as conn:
+        created = ensure_audit_partitions(conn)
+
+    with engine.begin() as conn:
+        dropped = drop_expired_audit_partitions(conn)
+    if dropped:
+        invalidate_cache_sync("audit")
+
+    logger.info(f"Audit partitions: created={created} dropped={dropped}")
+    return {"created": created, "dropped": dropped}
+
+
+# ==========================================================
+# JOB STATS ROLLUP (BEAT, EVERY JOB_STATS_RECONCILE_SECONDS)
+# ==========================================================
+@celery_app.task(name="app.worker.maintenance.reconcile_job_stats_task")
+def reconcile_job_stats_task():
+    db = SessionLocal()
+    try:
+        rows = reconcile_job_stats(db, settings.JOB_STATS_RECONCILE_DAYS)
+        invalidate_cache_sync("jobs")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"Job stats reconciled: {rows} rows over {settings.JOB_STATS_RECONCILE_DAYS} days")
+    return {"rows": rows, "days": settings.JOB_STATS_RECONCILE_DAYS}
@@ -0,0 +1,114 @@
+# app/worker/payloads.py
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import List, Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger("netdevops.worker")
+
+# ==========================================================
+# CLAIM-CHECK PAYLOAD STORE
+# ==========================================================
+# Large task arguments (config lines, verify commands) are stored
+# once in Redis under their SHA-256 digest. The Celery message only
+# carries a small reference: {"$ref": "sha256:<digest>"}.
+#
+# Identical payloads (bulk rollouts) map to the same key, so they are
+# stored once no matter how many jobs reference them.
+
+PAYLOAD_KEY_PREFIX = "payload:"
+REF_FIELD = "$ref"
+
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+
+    return _redis_client
+
+
+def _encode(lines: List[str]) -> bytes:
+    return json.dumps(lines, separators=(",", ":")).encode("utf-8")
+
+
+def is_ref(value) -> bool:
+    return isinstance(value, dict) and REF_FIELD in value
+
+
+# ----------------------------------------
+# Producer side
+# ----------------------------------------
+def store_payload(lines: List[str]) -> dict:
+    """
+    Store a payload content-addressed and return its reference.
+    Existing payloads only get their TTL refreshed.
+    """
+    data = _encode(lines)
+    digest = hashlib.sha256(data).hexdigest()
+    key = f"{PAYLOAD_KEY_PREFIX}{digest}"
+
+    client = _get_redis()
+    ttl = settings.PAYLOAD_TTL_SECONDS
+
+    # SET NX: never rewrite a payload that is already stored
+    if not client.set(key, data, ex=ttl, nx=True):
+        client.expire(key, ttl)
+
+    return {REF_FIELD: f"sha256:{digest}", "size": len(data)}
+
+
+def pack_payload(lines: Optional[List[str]]):
+    """
+    Return the value to put in the task message: small payloads stay
+    inline, large ones are replaced by a claim-check reference.
+    """
+    if not lines:
+        return lines
+
+    if len(_encode(lines)) <= settings.PAYLOAD_INLINE_MAX_BYTES:
+        return lines
+
+    return store_payload(lines)
+
+
+# ----------------------------------------
+# Consumer side
+# ----------------------------------------
+@lru_cache(maxsize=128)
+def _fetch_payload(digest: str) -> tuple:
+    data = _get_redis().get(f"{PAYLOAD_KEY_PREFIX}{digest}")
+
+    if data is None:
+        raise LookupError(f"Payload sha256:{digest} not found (expired?)")
+
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise ValueError(f"Payload sha256:{digest} failed integrity check")
+
+    # tuple: cached value must be immutable
+    return tuple(json.loads(data))
+
+
+def resolve_payload(value) -> Optional[List[str]]:
+    """
+    Turn a task argument back into a list of lines.
+    Accepts inline lists (old messages) and claim-check references.
+    Fetched payloads are cached per worker process by digest.
+    """
+    if not is_ref(value):
+        return value
+
+    algo, _, digest = value[REF_FIELD].partition(":")
+    if algo != "sha256" or not digest:
+        raise ValueError(f"Unsupported payload reference: {value[REF_FIELD]}")
+
+    return list(_fetch_payload(digest))
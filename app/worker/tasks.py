@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from app.db.database import SessionLocal
-from app.models.job import JobDB, JobAttempt, JobLog
+from app.worker.job_state import begin_attempt, finish_attempt
 
 # -----------------------------
 # Celery Import (SAFE)
@@ -16,75 +16,30 @@ except ImportError:
 # -----------------------------
 # CORE LOGIC (NO METRICS HERE)
 # -----------------------------
+# Round trips: begin_attempt (1 statement + commit) and
+# finish_attempt (1 statement + commit). See app/worker/job_state.py.
 def _run_job_impl(job_id: int):
     db = SessionLocal()
-    job = None
-    attempt = None 
+    attempt_id = None
 
     try:
-        job = db.get(JobDB, job_id)
-        if not job:
-            raise ValueError(f"Job {job_id} not found")
-
-        job.status = "RUNNING"
-        db.commit()
-
-        attempt_no = (
-            db.query(JobAttempt)
-            .filter(JobAttempt.job_id == job_id)
-            .count()
-            + 1
-        )
-
-        attempt = JobAttempt(
-            job_id=job_id,
-            attempt_no=attempt_no,
-            started_at=datetime.utcnow(),
-        )
-
-        db.add(attempt)
-        db.commit()
-        db.refresh(attempt)
-
-        db.add(
-            JobLog(
-                job_id=job_id,
-                attempt_id=attempt.id,
-                output="Executing job...\nJob completed successfully.",
-                exit_code=0,
-            )
-        )
-
-        job.status = "SUCCESS"
-        attempt.completed_at = datetime.utcnow()
-        attempt.exit_code = 0
-
-        db.commit()
+        attempt_id, _attempt_no = begin_attempt(db, job_id)
 
-        return {"job_id": job_id, "status": "SUCCESS"}
-
-    except Exception as exc:
-        try:
-            db.add(
-                JobLog(
-                    job_id=job_id,
-                    attempt_id=attempt.id if attempt else None,
-                    output=str(exc),
-                    exit_code=1,
-                )
-            )
+        output = "Executing job...\nJob completed successfully."
 
-            if job:
-                job.status = "FAILED"
+        finish_attempt(db, job_id, attempt_id, "SUCCESS", 0, output)
 
-            if attempt:
-                attempt.completed_at = datetime.utcnow()
-                attempt.exit_code = 1
-
-            db.commit()
+        return {"job_id": job_id, "status": "SUCCESS"}
 
-        except Exception:
-            db.rollback()
+    except Exception as exc:
+        db.rollback()
+
+        # No attempt means the job does not exist: nothing to record
+        if attempt_id is not None:
+            try:
+                finish_attempt(db, job_id, attempt_id, "FAILED", 1, str(exc))
+            except Exception:
+                db.rollback()
 
         raise
 
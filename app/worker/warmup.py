@@ -0,0 +1,147 @@
+# app/worker/warmup.py
+
+import importlib
+import logging
+import os
+import time
+
+from sqlalchemy import select
+
+from app.core.config import settings
+
+logger = logging.getLogger("netdevops.worker")
+
+# ==========================================================
+# WORKER PROCESS WARM-UP
+# ==========================================================
+# Runs once per process that executes tasks:
+#   - prefork: in every child, from worker_process_init
+#   - threads/solo: in the main process, from worker_ready
+# so the first job after a scale-up does not pay for cold connections,
+# imports, Vault round trips and rule parsing.
+
+_warmed_pid = None
+
+
+def _csv(value: str):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def _warm_db_pool(deadline: float):
+    from app.db.database import engine
+
+    # Connections inherited through fork() must not be reused by the child
+    engine.dispose(close=False)
+
+    conns = []
+    try:
+        for _ in range(settings.WORKER_WARMUP_DB_CONNECTIONS):
+            if time.monotonic() > deadline:
+                logger.warning("Warm-up: DB connections stopped at time budget")
+                break
+            conns.append(engine.connect())
+    finally:
+        for conn in conns:
+            conn.close()  # back to the pool, still open
+
+    return len(conns)
+
+
+def _warm_modules(deadline: float):
+    imported = 0
+    for name in _csv(settings.WORKER_WARMUP_MODULES):
+        if time.monotonic() > deadline:
+            logger.warning("Warm-up: module imports stopped at time budget")
+            break
+        importlib.import_module(name)
+        imported += 1
+
+    return imported
+
+
+def _hot_secret_paths():
+    from app.db.database import SessionLocal
+    from app.models.device import DeviceDB
+
+    paths = _csv(settings.WORKER_PREFETCH_SECRETS)
+
+    db = SessionLocal()
+    try:
+        paths += db.scalars(
+            select(DeviceDB.credentials_ref)
+            .where(DeviceDB.credentials_ref.isnot(None))
+            .group_by(DeviceDB.credentials_ref)
+            .order_by(DeviceDB.credentials_ref)
+            .limit(settings.WORKER_PREFETCH_SECRETS_LIMIT)
+        ).all()
+    finally:
+        db.close()
+
+    return list(dict.fromkeys(paths))
+
+
+def _warm_secrets(deadline: float):
+    from app.utils.secrets import get_secret_cached
+
+    fetched = 0
+    for path in _hot_secret_paths():
+        if time.monotonic() > deadline:
+            logger.warning("Warm-up: secret prefetch stopped at time budget")
+            break
+        try:
+            get_secret_cached(path)
+            fetched += 1
+        except Exception as e:
+            logger.warning(f"Warm-up: secret {path} not prefetched: {e}")
+
+    return fetched
+
+
+def _warm_rules():
+    from rules.rule_loader import get_rules_index
+    from rules.recommendation_engine import load_recommendation_rules
+
+    load_recommendation_rules()
+    return len(get_rules_index())
+
+
+def warm_up_worker():
+    """
+    Warm up the current process and mark it ready.
+    Every step is best effort: a failed step is logged and the process
+    still becomes ready (it then warms lazily, as before).
+    """
+    global _warmed_pid
+
+    pid = os.getpid()
+    if _warmed_pid == pid:
+        return
+
+    start = time.time()
+    # Celery kills a prefork child whose init exceeds worker_proc_alive_timeout
+    deadline = time.monotonic() + settings.WORKER_WARMUP_TIMEOUT_SECONDS
+    steps = {
+        "db_connections": lambda: _warm_db_pool(deadline),
+        "modules": lambda: _warm_modules(deadline),
+        "rules": _warm_rules,
+        "secrets": lambda: _warm_secrets(deadline),
+    }
+
+    summary = {}
+    for name, step in steps.items():
+        # out of budget: the remaining steps happen lazily on first use
+        if time.monotonic() > deadline:
+            summary[name] = "skipped"
+            continue
+        try:
+            summary[name] = step()
+        except Exception as e:
+            logger.warning(f"Warm-up step '{name}' failed: {e}")
+            summary[name] = "failed"
+
+    _warmed_pid = pid
+
+    from app.worker.health import mark_process_ready
+    mark_process_ready(pid)
+
+    logger.info(f"Worker process {pid} warmed up in {time.time() - start:.2f}s: {summary}")
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -10,9 +11,10 @@ RECOMMENDATIONS_FILE = (
 )
 
 
+@lru_cache(maxsize=1)
 def load_recommendation_rules():
     """
-    Load investigation recommendation rules.
+    Load investigation recommendation rules (cached per process).
     """
 
     with open(RECOMMENDATIONS_FILE, "r", encoding="utf-8") as file:
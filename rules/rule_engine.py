@@ -1,4 +1,4 @@
-from rules.rule_loader import load_rules
+from rules.rule_loader import get_rules_index
 
 
 def determine_root_cause(summary):
@@ -8,18 +8,16 @@ def determine_root_cause(summary):
 
     incident_type = summary["incident_type"]
 
-    rules = load_rules()
+    rule = get_rules_index().get(incident_type)
 
-    for rule in rules:
+    if rule:
 
-        if rule["id"] == incident_type:
-
-            return {
-                  "id": rule["id"],
-                  "name": rule["name"],
-                  "hint": rule["hint"],
-                  "confidence": rule["confidence"]
-}
+        return {
+            "id": rule["id"],
+            "name": rule["name"],
+            "hint": rule["hint"],
+            "confidence": rule["confidence"]
+        }
 
     return {
         "id": "unknown",
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -72,6 +73,15 @@ def load_rules():
     return rules
 
 
+@lru_cache(maxsize=1)
+def get_rules_index():
+    """
+    Load and validate rules once per process, indexed by rule id.
+    """
+
+    return {rule["id"]: rule for rule in load_rules()}
+
+
 if __name__ == "__main__":
 
     rules = load_rules()
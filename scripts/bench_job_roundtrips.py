@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+"""
+Count DB round trips of one trivial job run (_run_job_impl).
+
+Needs a migrated database (DATABASE_URL). Creates a throwaway device and
+job, runs the job N times and reports statements and commits per run.
+
+Two code paths, measured the same way:
+
+    --path after   _run_job_impl: begin_attempt CTE / commit /
+                   finish_attempt CTE / commit
+    --path before  the previous ORM sequence, kept here for comparison:
+                   get / commit / count / insert / commit / refresh /
+                   output chunk / log + job + attempt updates / commit
+
+Usage:
+    python -m scripts.bench_job_roundtrips --runs 20 --path before
+    python -m scripts.bench_job_roundtrips --runs 20 --path after
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.db.database import SessionLocal, engine
+from app.models.device import DeviceDB
+from app.models.job import JobDB, JobAttempt, JobLog, JobLogChunk, JobStatsDaily
+from app.utils.blobstore import blob_path
+from app.utils.job_output import JobOutputWriter
+from app.worker.tasks import _run_job_impl
+
+
+# --------------------------------------------------------
+# Counters (engine events)
+# --------------------------------------------------------
+
+counts = {"statements": 0, "commits": 0}
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counts["statements"] += 1
+
+
+@event.listens_for(engine, "commit")
+def _count_commit(conn):
+    counts["commits"] += 1
+
+
+# --------------------------------------------------------
+# Fixture rows
+# --------------------------------------------------------
+
+def create_job():
+
+    db = SessionLocal()
+    try:
+        device = DeviceDB(name=f"bench-device-{os.getpid()}", ip="192.0.2.1", platform="cisco_ios", credentials_ref="bench")
+        db.add(device)
+        db.flush()
+        job = JobDB(name="bench-job", device_id=device.id, command="show version")
+        db.add(job)
+        db.commit()
+        return device.id, job.id
+    finally:
+        db.close()
+
+
+def cleanup(device_id, job_id):
+
+    db = SessionLocal()
+    try:
+        blob_keys = {
+            key for (key,) in db.query(JobLog.output_blob)
+            .filter(JobLog.job_id == job_id, JobLog.output_blob.isnot(None))
+        }
+
+        for model in (JobLogChunk, JobLog, JobAttempt):
+            db.query(model).filter(model.job_id == job_id).delete()
+        db.query(JobDB).filter(JobDB.id == job_id).delete()
+        # finish_attempt rolls every run into job_stats_daily
+        db.query(JobStatsDaily).filter(JobStatsDaily.device_id == device_id).delete()
+        db.query(DeviceDB).filter(DeviceDB.id == device_id).delete()
+        db.commit()
+
+        # blobs are content-addressed: keep any still referenced elsewhere
+        for key in blob_keys:
+            if db.query(JobLog.id).filter(JobLog.output_blob == key).first() is None:
+                try:
+                    os.remove(blob_path(key))
+                except FileNotFoundError:
+                    pass
+    finally:
+        db.close()
+
+
+# --------------------------------------------------------
+# Previous implementation (ORM, one round trip per step)
+# --------------------------------------------------------
+
+def run_job_before(job_id):
+
+    db = SessionLocal()
+    try:
+        job = db.get(JobDB, job_id)
+        job.status = "RUNNING"
+        db.commit()
+
+        attempt_no = db.query(JobAttempt).filter(JobAttempt.job_id == job_id).count() + 1
+        attempt = JobAttempt(job_id=job_id, attempt_no=attempt_no, started_at=datetime.utcnow())
+        db.add(attempt)
+        db.commit()
+        db.refresh(attempt)
+
+        output = "Executing job...\nJob completed successfully."
+        with JobOutputWriter(job_id, attempt.id) as out:
+            out.write(output)
+
+        db.add(JobLog(job_id=job_id, attempt_id=attempt.id, output=output, exit_code=0))
+        job.status = "SUCCESS"
+        attempt.completed_at = datetime.utcnow()
+        attempt.exit_code = 0
+        db.commit()
+    finally:
+        db.close()
+
+
+PATHS = {
+    "before": run_job_before,
+    "after": _run_job_impl,
+}
+
+
+# --------------------------------------------------------
+# Main
+# --------------------------------------------------------
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--path", choices=sorted(PATHS), default="after")
+    args = parser.parse_args()
+
+    run = PATHS[args.path]
+
+    device_id, job_id = create_job()
+
+    try:
+        counts.update(statements=0, commits=0)
+        start = time.perf_counter()
+
+        for _ in range(args.runs):
+            run(job_id)
+
+        elapsed = time.perf_counter() - start
+
+        print(json.dumps({
+            "path": args.path,
+            "runs": args.runs,
+            "statements_per_run": counts["statements"] / args.runs,
+            "commits_per_run": counts["commits"] / args.runs,
+            "round_trips_per_run": (counts["statements"] + counts["commits"]) / args.runs,
+            "ms_per_run": round(elapsed * 1000 / args.runs, 2),
+        }, indent=2))
+
+    finally:
+        cleanup(device_id, job_id)
+
+
+if __name__ == "__main__":
+    main()
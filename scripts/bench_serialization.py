@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+"""
+Serialization benchmark for large list responses.
+
+Builds representative payloads as real SQLAlchemy result rows (in-memory
+SQLite, same tables as the API) and times three ways of rendering them:
+
+    default   jsonable_encoder + starlette JSONResponse (stdlib json)
+    encoder   jsonable_encoder + FastJSONResponse (endpoint returns a dict)
+    direct    FastJSONResponse only (endpoint returns the response itself)
+
+No database server is needed, but app settings must load (any
+DATABASE_URL works, no connection is made):
+
+    python -m scripts.bench_serialization --devices 5000 --audit 2000 --logs 500
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import Column, MetaData, Table, create_engine, insert, select
+
+from app.models.audit import AuditEvent
+from app.models.device import DeviceDB
+from app.models.job import JobLog
+from app.utils.fast_json import FastJSONResponse, serializer_name
+
+
+# --------------------------------------------------------
+# Representative payloads
+# --------------------------------------------------------
+
+def column_copy(table, metadata):
+
+    # same columns and types, no Postgres-only constraints/options
+    return Table(table.name, metadata, *[Column(c.name, c.type) for c in table.c])
+
+
+def build_payloads(devices, audit, logs):
+
+    engine = create_engine("sqlite://")
+    metadata = MetaData()
+    device_t = column_copy(DeviceDB.__table__, metadata)
+    audit_t = column_copy(AuditEvent.__table__, metadata)
+    log_t = column_copy(JobLog.__table__, metadata)
+    metadata.create_all(engine)
+
+    now = datetime.utcnow()
+
+    with engine.begin() as conn:
+        conn.execute(insert(device_t), [
+            {
+                "id": i,
+                "name": f"edge-{i:05d}",
+                "ip": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+                "platform": "cisco_ios",
+                "credentials_ref": f"secret/devices/edge-{i:05d}",
+                "port": 22,
+            }
+            for i in range(1, devices + 1)
+        ])
+        conn.execute(insert(audit_t), [
+            {
+                "id": i,
+                "user_id": i % 50,
+                "username": f"user{i % 50}",
+                "role": "admin",
+                "action": "push_config",
+                "target": f"edge-{i % 1000:05d}",
+                "endpoint": f"http://api/api/v1/jobs/run/{i}",
+                "timestamp": now - timedelta(seconds=i),
+                "details": {"job_id": i, "lines": 12, "dry_run": False},
+            }
+            for i in range(1, audit + 1)
+        ])
+        conn.execute(insert(log_t), [
+            {
+                "id": i,
+                "job_id": i,
+                "attempt_id": i,
+                "output": "interface GigabitEthernet0/1\n description uplink\n" * 80,
+                "exit_code": 0,
+            }
+            for i in range(1, logs + 1)
+        ])
+
+        payloads = {
+            "devices": {
+                "devices": conn.execute(select(
+                    device_t.c.id, device_t.c.name, device_t.c.ip, device_t.c.platform, device_t.c.port
+                )).mappings().all(),
+            },
+            "audit": {"items": conn.execute(select(audit_t)).mappings().all()},
+            "job_logs": {"logs": conn.execute(select(log_t)).mappings().all()},
+        }
+
+    return payloads
+
+
+# --------------------------------------------------------
+# Timing
+# --------------------------------------------------------
+
+def best_of(fn, repeat):
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(payload, repeat):
+
+    default = JSONResponse(content=None)
+    fast = FastJSONResponse(content=None)
+
+    body = fast.render(payload)
+
+    return {
+        "bytes": len(body),
+        "default_ms": best_of(lambda: default.render(jsonable_encoder(payload)), repeat) * 1000,
+        "encoder_ms": best_of(lambda: fast.render(jsonable_encoder(payload)), repeat) * 1000,
+        "direct_ms": best_of(lambda: fast.render(payload), repeat) * 1000,
+    }
+
+
+# --------------------------------------------------------
+# Main
+# --------------------------------------------------------
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=5000)
+    parser.add_argument("--audit", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.devices, args.audit, args.logs)
+
+    results = {}
+    for name, payload in payloads.items():
+        r = bench(payload, args.repeat)
+        r["speedup_direct"] = round(r["default_ms"] / r["direct_ms"], 1)
+        results[name] = {k: round(v, 2) if isinstance(v, float) else v for k, v in r.items()}
+
+    print(json.dumps({"serializer": serializer_name(), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+"""
+Worker pool benchmark: concurrent device sessions per GB of RAM.
+
+Start ONE worker in the pool mode under test, then run this script on
+the same host (or inside the worker container) with the worker's main PID:
+
+    celery -A app.worker.celery_app:celery_app worker -Q device_io \
+        --pool=prefork --concurrency=16
+    python -m scripts.bench_worker_pool --pid <worker-pid> --sessions 16
+
+    celery -A app.worker.celery_app:celery_app worker -Q device_io \
+        --pool=threads --concurrency=128
+    python -m scripts.bench_worker_pool --pid <worker-pid> --sessions 128
+
+See docs/worker_pool_modes.md for the method and how to record results.
+"""
+
+import argparse
+import json
+import os
+import time
+
+from app.worker.celery_app import celery_app, io_probe_task
+
+
+# --------------------------------------------------------
+# /proc helpers (Linux only, no extra dependencies)
+# --------------------------------------------------------
+
+def read_rss_kb(pid):
+
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except FileNotFoundError:
+        pass
+
+    return 0
+
+
+def child_pids(pid):
+
+    children = []
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r", encoding="utf-8") as fh:
+                fields = fh.read().rsplit(")", 1)[1].split()
+        except (FileNotFoundError, ProcessLookupError, IndexError):
+            continue
+        if int(fields[1]) == pid:
+            children.append(int(entry))
+
+    return children
+
+
+def tree_rss_kb(pid):
+
+    total = read_rss_kb(pid)
+
+    for child in child_pids(pid):
+        total += tree_rss_kb(child)
+
+    return total
+
+
+# --------------------------------------------------------
+# Active session count (as reported by the worker itself)
+# --------------------------------------------------------
+
+def active_sessions():
+
+    active = celery_app.control.inspect(timeout=2.0).active() or {}
+
+    return sum(
+        1
+        for tasks in active.values()
+        for task in tasks
+        if task.get("name") == io_probe_task.name
+    )
+
+
+# --------------------------------------------------------
+# Main
+# --------------------------------------------------------
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pid", type=int, required=True, help="worker main PID")
+    parser.add_argument("--sessions", type=int, required=True)
+    parser.add_argument("--hold", type=float, default=60.0,
+                        help="seconds each simulated session stays open")
+    parser.add_argument("--settle", type=float, default=15.0,
+                        help="seconds to wait before sampling")
+    args = parser.parse_args()
+
+    # Baseline = the worker's main process alone. The idle tree already
+    # holds every prefork child (spawned at startup), so a delta against
+    # it would hide exactly the per-session cost being compared.
+    base_kb = read_rss_kb(args.pid)
+    idle_kb = tree_rss_kb(args.pid)
+
+    for _ in range(args.sessions):
+        io_probe_task.apply_async(args=[args.hold])
+
+    time.sleep(args.settle)
+
+    busy_kb = tree_rss_kb(args.pid)
+    sessions = active_sessions()
+    busy_gb = busy_kb / (1024 * 1024)
+
+    # marginal cost: what each open session adds on top of the base process
+    per_session_kb = (busy_kb - base_kb) / max(sessions, 1)
+
+    print(json.dumps({
+        "requested_sessions": args.sessions,
+        "active_sessions": sessions,
+        "base_rss_mb": round(base_kb / 1024, 1),
+        "idle_rss_mb": round(idle_kb / 1024, 1),
+        "busy_rss_mb": round(busy_kb / 1024, 1),
+        "rss_per_session_mb": round(per_session_kb / 1024, 2),
+        "sessions_per_gb": round(sessions / busy_gb, 1) if busy_gb else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+"""
+Build precompressed static assets.
+
+Reads app/static/ and writes app/static/dist/ (served at /static):
+
+    <name>                  copy of the asset    (Cache-Control: no-cache)
+    <name>.gz               gzip -9 of the copy  (served as-is)
+    manifest.json           built asset names, written last
+
+The assets are HTML entry pages opened by fixed URL (/dashboard), so
+they keep their names and are revalidated by ETag rather than renamed
+by content hash. Output is deterministic (gzip mtime 0): unchanged
+assets keep their ETags across builds. Stdlib only: runs in the image
+build without app settings.
+
+Usage:
+    python -m scripts.build_static
+"""
+
+import argparse
+import gzip
+import json
+import shutil
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = PROJECT_ROOT / "app" / "static"
+
+ASSET_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt"}
+MANIFEST_FILE = "manifest.json"
+
+
+# --------------------------------------------------------
+# Build
+# --------------------------------------------------------
+
+def write_with_gzip(path: Path, data: bytes):
+
+    path.write_bytes(data)
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def build(source: Path, dist: Path) -> list:
+
+    if dist.exists():
+        shutil.rmtree(dist)
+    dist.mkdir(parents=True)
+
+    built = []
+
+    for asset in sorted(source.iterdir()):
+        if not asset.is_file() or asset.suffix not in ASSET_SUFFIXES:
+            continue
+
+        data = asset.read_bytes()
+        write_with_gzip(dist / asset.name, data)
+        built.append(asset.name)
+
+        print(f"{asset.name:<28} {len(data)} B, gz {len(gzip.compress(data, 9, mtime=0))} B")
+
+    # marks the build complete: the app only serves dist/ once it exists
+    (dist / MANIFEST_FILE).write_text(json.dumps({"assets": built}, indent=2) + "\n")
+    return built
+
+
+# --------------------------------------------------------
+# Main
+# --------------------------------------------------------
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", type=Path, default=SOURCE_DIR)
+    parser.add_argument("--dist", type=Path, default=None, help="default: <source>/dist")
+    args = parser.parse_args()
+
+    built = build(args.source, args.dist or args.source / "dist")
+    print(f"{len(built)} assets built")
+
+
+if __name__ == "__main__":
+    main()
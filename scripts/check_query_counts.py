@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""
+Query count regression check for the job list/detail endpoints.
+
+Seeds one device with jobs, attempts and logs, calls the endpoint
+functions with small and large page sizes and counts the SQL statements
+each call executes. The count must match EXPECTED_QUERIES and must not
+grow with the page size (no N+1). Seed rows are removed afterwards.
+
+Exit code 1 on any mismatch.
+
+Usage (migrated database, DATABASE_URL set):
+    alembic upgrade head && python -m scripts.check_query_counts
+"""
+
+import asyncio
+import os
+import sys
+
+from sqlalchemy import delete, event
+
+from app.api.v1 import jobs_api
+from app.db.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models.device import DeviceDB
+from app.models.job import JobDB, JobAttempt, JobLog
+
+SEED_JOBS = 30
+SEED_ATTEMPTS_PER_JOB = 3
+
+EXPECTED_QUERIES = {
+    "list_jobs": 3,       # jobs + attempts + logs
+    "get_job_detail": 3,  # job + attempts + logs page
+}
+
+
+# --------------------------------------------------------
+# Seed data
+# --------------------------------------------------------
+
+def seed():
+
+    db = SessionLocal()
+    try:
+        device = DeviceDB(name=f"query-count-check-{os.getpid()}", ip="192.0.2.1", platform="cisco_ios", credentials_ref="none")
+        db.add(device)
+        db.flush()
+
+        job_ids = []
+        for i in range(SEED_JOBS):
+            job = JobDB(name=f"query-count-{i}", device_id=device.id, command="show version")
+            db.add(job)
+            db.flush()
+            job_ids.append(job.id)
+
+            for n in range(SEED_ATTEMPTS_PER_JOB):
+                attempt = JobAttempt(job_id=job.id, attempt_no=n + 1, exit_code=0)
+                db.add(attempt)
+                db.flush()
+                db.add(JobLog(job_id=job.id, attempt_id=attempt.id, output="ok", exit_code=0))
+
+        db.commit()
+        return device.id, job_ids
+
+    finally:
+        db.close()
+
+
+def cleanup(device_id, job_ids):
+
+    db = SessionLocal()
+    try:
+        db.execute(delete(JobLog).where(JobLog.job_id.in_(job_ids)))
+        db.execute(delete(JobAttempt).where(JobAttempt.job_id.in_(job_ids)))
+        db.execute(delete(JobDB).where(JobDB.id.in_(job_ids)))
+        db.execute(delete(DeviceDB).where(DeviceDB.id == device_id))
+        db.commit()
+    finally:
+        db.close()
+
+
+# --------------------------------------------------------
+# Counting
+# --------------------------------------------------------
+
+class QueryCounter:
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+async def count_queries(counter, call):
+
+    async with AsyncSessionLocal() as db:
+        counter.count = 0
+        await call(db)
+        return counter.count
+
+
+async def run_checks(device_id, job_ids):
+
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+
+    # list_jobs is wrapped by @cached_response: call the undecorated route
+    # so every call runs its SQL (no request, no Redis)
+    list_jobs = jobs_api.list_jobs.__wrapped__
+
+    cases = {
+        "list_jobs": lambda limit: lambda db: list_jobs(
+            status=None, device_id=device_id, before=None, limit=limit, db=db
+        ),
+        "get_job_detail": lambda limit: lambda db: jobs_api.get_job_detail(
+            job_ids[0], logs_after=0, logs_limit=limit, db=db
+        ),
+    }
+
+    failures = []
+
+    try:
+        # first connection runs driver setup statements: keep them out
+        await count_queries(counter, cases["list_jobs"](1))
+
+        for name, make_call in cases.items():
+            small = await count_queries(counter, make_call(2))
+            large = await count_queries(counter, make_call(SEED_JOBS))
+            expected = EXPECTED_QUERIES[name]
+
+            if small == large == expected:
+                print(f"OK    {name}: {small} queries")
+            else:
+                failures.append(name)
+                print(f"FAIL  {name}: expected {expected}, got {small} (small page) / {large} (large page)")
+
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", counter)
+        await async_engine.dispose()
+
+    return failures
+
+
+def main():
+
+    device_id, job_ids = seed()
+
+    try:
+        failures = asyncio.run(run_checks(device_id, job_ids))
+    finally:
+        cleanup(device_id, job_ids)
+
+    if failures:
+        print(f"\n{len(failures)} endpoints exceed their query budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
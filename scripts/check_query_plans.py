@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+Query plan regression check for hot queries.
+
+Runs EXPLAIN (FORMAT JSON) for every query in HOT_QUERIES with
+enable_seqscan = off. Small CI tables would make the planner prefer a
+sequential scan anyway; with seq scans disabled, a "Seq Scan" can only
+remain in the plan when NO usable index exists, which is exactly the
+regression to catch.
+
+Exit code 1 when any hot query falls back to a sequential scan.
+
+Usage (migrated database, DATABASE_URL set):
+    alembic upgrade head && python -m scripts.check_query_plans
+"""
+
+import json
+import sys
+
+from sqlalchemy import inspect, text
+
+from app.db.database import engine
+
+
+# --------------------------------------------------------
+# Hot queries: (name, table that must not be seq-scanned, SQL)
+# --------------------------------------------------------
+
+HOT_QUERIES = [
+    (
+        "job attempts by job",
+        "job_attempts",
+        "SELECT * FROM job_attempts WHERE job_id = 1 ORDER BY attempt_no",
+    ),
+    (
+        "jobs by device and status",
+        "jobs",
+        "SELECT * FROM jobs WHERE device_id = 1 AND status = 'RUNNING'",
+    ),
+    (
+        "pending jobs, oldest first",
+        "jobs",
+        "SELECT id FROM jobs WHERE status = 'PENDING' ORDER BY created_at LIMIT 100",
+    ),
+    (
+        "job logs by job",
+        "job_logs",
+        "SELECT * FROM job_logs WHERE job_id = 1 ORDER BY created_at",
+    ),
+    (
+        "job output tail",
+        "job_log_chunks",
+        "SELECT seq, data FROM job_log_chunks WHERE job_id = 1 AND seq > 0 ORDER BY seq LIMIT 50",
+    ),
+    (
+        "latest audit events",
+        "audit_events",
+        "SELECT * FROM audit_events ORDER BY timestamp DESC, id DESC LIMIT 100",
+    ),
+    (
+        "audit events by user, next page",
+        "audit_events",
+        "SELECT * FROM audit_events WHERE user_id = 1 "
+        "AND (timestamp, id) < ('2030-01-01', 1000) "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+    ),
+    (
+        "audit events in a time range (partition pruning)",
+        "audit_events",
+        "SELECT * FROM audit_events WHERE timestamp >= now() - interval '1 day' "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+    ),
+    (
+        "audit events by action",
+        "audit_events",
+        "SELECT * FROM audit_events WHERE action = 'login' "
+        "ORDER BY timestamp DESC, id DESC LIMIT 100",
+    ),
+    (
+        "latest snapshot per device",
+        "config_snapshots",
+        "SELECT content_hash FROM config_snapshots WHERE device_id = 1 "
+        "ORDER BY created_at DESC, id DESC LIMIT 1",
+    ),
+    (
+        "devices by platform, next page",
+        "devices",
+        "SELECT id, name, ip, platform, port FROM devices "
+        "WHERE platform = 'cisco_ios' AND id > 100 ORDER BY id LIMIT 100",
+    ),
+    (
+        "devices by name prefix",
+        "devices",
+        "SELECT id, name, ip, platform, port FROM devices WHERE name LIKE 'core-%' ORDER BY id LIMIT 100",
+    ),
+    (
+        "user login",
+        "users",
+        "SELECT * FROM users WHERE username = 'admin'",
+    ),
+]
+
+
+# --------------------------------------------------------
+# Plan inspection
+# --------------------------------------------------------
+
+def seq_scans(plan_node, found=None):
+
+    found = [] if found is None else found
+
+    if plan_node.get("Node Type") == "Seq Scan":
+        found.append(plan_node.get("Relation Name"))
+
+    for child in plan_node.get("Plans", []):
+        seq_scans(child, found)
+
+    return found
+
+
+def partitions_of(conn, table):
+
+    # every partition, whatever its name (monthly, default, ...)
+    return set(conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = CAST(:parent AS regclass)"
+    ), {"parent": table}).scalars())
+
+
+def main():
+
+    failures = []
+
+    with engine.connect() as conn:
+
+        tables = set(inspect(conn).get_table_names())
+        conn.execute(text("SET enable_seqscan = off"))
+
+        for name, table, sql in HOT_QUERIES:
+
+            if table not in tables:
+                print(f"SKIP  {name}: table '{table}' does not exist")
+                continue
+
+            raw = conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+            plan = raw if isinstance(raw, list) else json.loads(raw)
+
+            scanned = seq_scans(plan[0]["Plan"])
+
+            # partitioned tables report the partition (audit_events_p202601,
+            # audit_events_default, ...), never the parent
+            relations = {table} | partitions_of(conn, table)
+            if any(rel in relations for rel in scanned):
+                failures.append(name)
+                print(f"FAIL  {name}: sequential scan on {table}")
+            else:
+                print(f"OK    {name}")
+
+    if failures:
+        print(f"\n{len(failures)} hot queries fall back to sequential scans")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()